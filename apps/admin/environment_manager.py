@@ -20,6 +20,7 @@ This dashboard has been upgraded to a true "Mission Control":
 
 import streamlit as st
 import registry_service  # <-- The "Engine"
+from common.data_access import get_visible_environments
 from datetime import datetime
 import json
 import graphviz # <-- [NEW] For Visual Lineage
@@ -71,6 +72,12 @@ class Page:
             st.error(f"Failed to load registry data: {e}")
             self.all_envs = []
 
+    def _envs_changed(self):
+        """Reloads the environments after a create/clone/edit, and drops
+        the cached sidebar list so it shows the change straight away."""
+        self.refresh_data()
+        get_visible_environments.clear()
+
     # --- TAB 1: DASHBOARD ---
     def _render_dashboard_tab(self):
         """Displays all environments in a filterable table."""
@@ -315,7 +322,7 @@ class Page:
                             )
 
                         if success:
-                            st.success(message); self.refresh_data(); st.rerun()
+                            st.success(message); self._envs_changed(); st.rerun()
                         else:
                             st.error(message)
 
@@ -368,7 +375,7 @@ class Page:
                                 versioning_logic="Latest Approved", # Use "Clean Snapshot" logic
                                 clone_plan_from_env_id=source_env_id # <-- [NEW] Promote the plan too!
                             )
-                            if success: st.success(message); self.refresh_data(); st.rerun()
+                            if success: st.success(message); self._envs_changed(); st.rerun()
                             else: st.error(message)
 
         # --- Section 2: Clone for Validation ---
@@ -406,7 +413,7 @@ class Page:
                                 versioning_logic="Carbon Copy (Forensic)", # Use "Full History" logic
                                 clone_plan_from_env_id=source_env_id # <-- [NEW] Clone the plan too!
                             )
-                            if success: st.success(message); self.refresh_data(); st.rerun()
+                            if success: st.success(message); self._envs_changed(); st.rerun()
                             else: st.error(message)
 
     # --- TAB 4: MANAGE & AUDIT ---
@@ -477,7 +484,7 @@ class Page:
                         success, message = registry_service.edit_environment(
                             selected_env_id, env_name, purpose, allowed_roles, status, self.user_id, comment
                         )
-                        if success: st.success(message); self.refresh_data(); st.rerun()
+                        if success: st.success(message); self._envs_changed(); st.rerun()
                         else: st.error(message)
 
         # --- [NEW] Feature: Prune Files "Danger Zone" ---
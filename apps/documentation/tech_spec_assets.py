@@ -0,0 +1,599 @@
+"""
+apps/documentation/tech_spec_assets.py
+
+Static content for the Technical Specification page (tech_spec.py):
+the Scenario 3 walkthrough, the data dictionary cards and the
+column-by-column schemas.
+
+This is plain data with no Streamlit calls. tech_spec.py imports it
+lazily, inside the functions that render it, so the large literals are
+only built once a user actually opens those tabs.
+"""
+
+# --- Scenario 3 (Data Model tab) ---
+# Scenario 3 (the backward-plan) is described as data and rendered by
+# tech_spec._scenario3_html(). A sub-item body is either HTML text or a list of
+# (column, value) pairs for an example row.
+SCEN3_TITLE = "Scenario 3: The Dynamic Backward-Plan (Our New Engine)"
+
+SCEN3_SCENE = (
+    'A Project Manager needs to plan the Q4 report, which is due on '
+    '<b>Dec 20th</b>. The "Final Report" [C] depends on both '
+    '"Data Gathering" [A] and "Model Run" [B].'
+)
+
+SCEN3_STEPS = [
+    {
+        "title": 'The PM creates the "Final Deadline" task:',
+        "items": [
+            ("Action", 'Creates task "Final Report" [C] (1 day duration) with a '
+                       'hard-coded <b><code>due_date</code></b> of <b>Dec 20</b>.'),
+            ("Table Updated", "<code>plan_project_milestones</code> (Table 9)"),
+            ("Example Row", [("milestone_id", "101"), ("title", "'Final Report'"),
+                             ("duration_days", "1"), ("due_date", "'2025-12-20'")]),
+        ],
+    },
+    {
+        "title": 'The PM creates the "Predecessor" tasks:',
+        "items": [
+            ("Action", 'Creates "Data Gathering" [A] (10 days) and "Model Run" [B] '
+                       '(5 days). For <em>both</em> of them, she uses the "This task '
+                       'depends on..." multiselect to choose "Final Report" [C].'),
+            ("Table Updated (1)", "<code>plan_project_milestones</code> [T9] receives "
+                                  "two new rows for Task A (ID <code>102</code>) and "
+                                  "Task B (ID <code>103</code>). Their "
+                                  "<code>due_date</code> is <code>NULL</code>."),
+            ("Table Updated (2)", "<code>plan_dependencies</code> (Table 11)"),
+            ("How", "<em>Two</em> new rows are <b>APPENDED</b> to create the links."),
+            ("Row 1", '<code>task_id=101</code> (Task C), '
+                      '<code>predecessor_task_id=102</code> (Task A). '
+                      '(Meaning: "C depends on A")'),
+            ("Row 2", '<code>task_id=101</code> (Task C), '
+                      '<code>predecessor_task_id=103</code> (Task B). '
+                      '(Meaning: "C depends on B")'),
+        ],
+    },
+    {
+        "title": 'The "Planning Engine" (in the UI) does the magic:',
+        "items": [
+            ("The Logic", "The engine finds the root (Task C, due Dec 20). "
+                          "It sees C must start on Dec 20."),
+            (None, "It tells all of C's predecessors (A and B): "
+                   '"You must both be finished by <b>Dec 19th</b>."'),
+            ("Calculates Task A", "10 days, due Dec 19 -> <b>Calculated Start: Dec 10</b>."),
+            ("Calculates Task B", "5 days, due Dec 19 -> <b>Calculated Start: Dec 15</b>."),
+        ],
+    },
+    {
+        "title": "Result:",
+        "text": 'The dashboard displays the "Calculated Project Start Date" as '
+                '<b>Dec 10th</b>. The engine has identified "Data Gathering" [A] '
+                'as the <b>Critical Path</b>.',
+    },
+]
+
+
+# --- Data Dictionary Cards (Data Dictionaries tab) ---
+# One record per table; the tab renders these in a single loop, two per row.
+
+DICT_SECTIONS = {
+    1: "The 'Blueprints' (Definition Tables)",
+    2: "The 'File Logs' (Instance Tables)",
+    3: "The 'Governance' (Linking Tables)",
+    4: "The 'Planning' (Project Management Tables)",
+}
+
+TABLE_CARDS = [
+    {
+        "id": 1, "section": 1, "icon": "🌍", "name": "bp_environments",
+        "what": "The master list of all valid environments.",
+        "how": (
+            'This is the "parent" table. Everything else (data, models, '
+            "reports) must belong to one of these environments."
+        ),
+        "why": (
+            "Lets you know <em>which version</em> of the truth you are looking "
+            "at (e.g., 'Production' vs. 'Reporting')."
+        ),
+    },
+    {
+        "id": 2, "section": 1, "icon": "📖", "name": "bp_file_templates",
+        "what": (
+            'The "master list" or "blueprint" for all <em>valid file '
+            "types</em>."
+        ),
+        "how": (
+            "Before a file can be uploaded, its <em>type</em> must be defined "
+            "here. This table stores all the validation rules."
+        ),
+        "why": (
+            'Guarantees that all data is <em>standardized</em>. No "rogue" or '
+            "undefined files can break the system."
+        ),
+    },
+    {
+        "id": 3, "section": 2, "icon": "📦", "name": "inst_data_input_files",
+        "what": (
+            'A log of all <em>raw data files</em> for the <b>"🚢 Data '
+            'Inputs"</b> stage.'
+        ),
+        "how": (
+            'A user (the "Doer") uploads a file, which <b>APPENDS</b> a new row'
+            " here."
+        ),
+        "why": (
+            "This is the 'raw material'. The app's "
+            "<code>data_last_updated</code> time comes from the "
+            "<code>created_at</code> timestamp of the <em>latest signed-off "
+            "file</em> from this table."
+        ),
+    },
+    {
+        "id": 4, "section": 2, "icon": "🤖", "name": "inst_actuarial_model_files",
+        "what": (
+            "A log of all files generated <em>during</em> a model run "
+            "(parameters, intermediate steps, etc.)."
+        ),
+        "how": (
+            'When a user (the "Doer") runs a model, it <b>APPENDS</b> new rows '
+            "here."
+        ),
+        "why": (
+            "Provides 100% <em>reproducibility</em>. We can link every "
+            "calculation <em>exactly</em> to its file fingerprint and the code "
+            "that ran."
+        ),
+    },
+    {
+        "id": 5, "section": 2, "icon": "✅", "name": "inst_result_files",
+        "what": (
+            "A log of the final, <em>validated, and aggregated</em> result "
+            "files."
+        ),
+        "how": (
+            'A user runs a "validation" job, which consumes model files (Table '
+            "4) and <b>APPENDS</b> a new row here."
+        ),
+        "why": (
+            'This is the "blessed" set of results <em>after</em> all automated '
+            "validation checks have passed."
+        ),
+    },
+    {
+        "id": 6, "section": 2, "icon": "📊", "name": "inst_report_files",
+        "what": (
+            "A log of the final, dashboard-ready files. This is the <b>last "
+            "step</b> in the data flow."
+        ),
+        "how": (
+            'A user runs a "reporting" job which consumes result files (Table '
+            "5) and <b>APPENDS</b> a new row here."
+        ),
+        "why": (
+            "This is the final, pre-calculated data that makes the dashboards "
+            "load <em>instantly</em>."
+        ),
+    },
+    {
+        "id": 7, "section": 3, "icon": "🔗", "name": "gov_file_lineage",
+        "what": (
+            'The factual "recipe" book. It\'s a simple log of parent-child '
+            "links."
+        ),
+        "how": (
+            'When a "Doer" runs a model, the app <b>APPENDS</b> rows here to '
+            "log <em>which</em> input files were used to create <em>which</em> "
+            "output file."
+        ),
+        "why": (
+            "This provides full, queryable, end-to-end lineage. It answers the "
+            'question, "What <em>exactly</em> built this report?"'
+        ),
+    },
+    {
+        "id": 8, "section": 3, "icon": "✍️", "name": "gov_audit_trail",
+        "what": (
+            "The <b>central, append-only AUDIT TRAIL</b> for all <em>human "
+            "decisions</em>."
+        ),
+        "how": (
+            'When a "Reviewer" clicks "Sign Off" or "Reject", the app '
+            "<b>APPENDS</b> a new row here."
+        ),
+        "why": (
+            'This is the "receipt" for all human sign-offs. It\'s the core of '
+            "our audit trail and the ultimate <b>source of trust</b>."
+        ),
+    },
+    {
+        "id": 9, "section": 4, "icon": "📅", "name": "plan_project_milestones",
+        "what": (
+            'A log of the "big rocks," or individual tasks that make up a '
+            "project plan."
+        ),
+        "how": (
+            'A manager uses the "Planning Engine" to create tasks and define '
+            "their duration and dependencies."
+        ),
+        "why": (
+            "This table stores the <em>tasks</em>. The <em>links</em> are "
+            "stored in Table 11."
+        ),
+    },
+    {
+        "id": 10, "section": 4, "icon": "📝", "name": "plan_action_items",
+        "what": 'A log of the "small tasks" or ad-hoc actions.',
+        "how": 'A user logs a "to-do" and assigns an owner.',
+        "why": 'A central, auditable "to-do" list.',
+        "note": "This table is <em>separate</em> from the main project plan.",
+    },
+    {
+        "id": 11, "section": 4, "icon": "🖇️", "name": "plan_dependencies",
+        "what": (
+            'The <b>new</b> "linking table" that creates the dependency web for'
+            " our Planning Engine."
+        ),
+        "how": (
+            'When a user says "Task C depends on Task A", a new row is added '
+            "here."
+        ),
+        "why": (
+            "This allows a task to have <em>multiple</em> predecessors, "
+            'enabling true "Critical Path" planning.'
+        ),
+    },
+]
+
+
+# --- Data Dictionary Schemas (Data Dictionaries tab) ---
+# One frozen tuple of (Column, Purpose, Example Entry) rows per table;
+# turned into a DataFrame once by tech_spec._table_df().
+
+SCHEMA_COLUMNS = ("Column", "Purpose", "Example Entry")
+
+TABLE_SCHEMAS = {
+    "bp_environments": (
+        ("env_id",
+         "🗝️ Key: A Unique text identifier ID (short name).",
+         "Rep.Q225"),
+        ("env_name",
+         "The human-friendly text name/folder name.",
+         "Reporting_Q225"),
+        ("env_cat",
+         "Category: Production, Reporting, Validation, Testing.",
+         "Reporting"),
+        ("purpose",
+         "A free-text description of the business purpose.",
+         "For Q2 2025 regulatory reporting."),
+        ("allowed_roles",
+         "🔒 Security: Comma-separated list of roles that can see this.",
+         "admin,risk,exec"),
+        ("current_status",
+         "⚠️ (Mutable) The workflow state of this env.",
+         "Locked"),
+        ("source_env_id",
+         "🔗 Linked: The env_id this was cloned from.",
+         "Prod.Q225_Draft"),
+        ("created_at",
+         "The timestamp of when this record was first created.",
+         "2025-05-01 10:30:00"),
+        ("creator_user_id",
+         "The text user ID of the person who first registered this.",
+         "jane.smith"),
+    ),
+    "bp_file_templates": (
+        ("template_id",
+         "🗝️ Key: A Unique text identifier for the file type.",
+         "biz_plan_q4"),
+        ("template_name",
+         "The human-friendly text name for this file type.",
+         "Q4 Business Plan"),
+        ("stage",
+         "The 4-folder data flow step this file belongs to.",
+         "Data Inputs"),
+        ("purpose",
+         "A free-text description of what this file type is for.",
+         "Holds the final, approved business plan."),
+        ("source_template_id",
+         "🔗 Linked: The template_id this file derives from.",
+         "model_v2_output"),
+        ("data_owner_team",
+         "The name of the team (text) responsible for this data.",
+         "Finance"),
+        ("data_sensitivity",
+         "Category: Confidential, Internal, Public.",
+         "Confidential"),
+        ("source_type",
+         "Category: Internal, External Third Party, External Connection.",
+         "Internal"),
+        ("source_name",
+         "Polymorphic: Team, Vendor, or Domain Key.",
+         "Finance Team"),
+        ("source_specifier",
+         "Polymorphic: Contact, Vendor Contact, or URL Path.",
+         "sarah.j@company.com"),
+        ("creation_method",
+         "The method (text) used to create this file.",
+         "Manual Upload"),
+        ("signoff_workflow",
+         "The human approval ruleset (text) for this file.",
+         "Doer + Reviewer"),
+        ("doer_roles",
+         '🔒 Security: Comma-separated list of roles allowed as "Doer".',
+         "admin,finance"),
+        ("reviewer_roles",
+         '🔒 Security: Comma-separated list of roles allowed as "Reviewer".',
+         "admin,finance_manager"),
+        ("expected_extension",
+         "The expected file extension (text).",
+         ".xlsx"),
+        ("min_file_size_kb",
+         "The minimum valid file size in KB (a number).",
+         "100"),
+        ("max_file_size_kb",
+         "The maximum valid file size in KB (a number).",
+         "10240"),
+        ("expected_structure",
+         "A flexible JSON (text) blob of the expected structure.",
+         '{"tabs": ["Summary", "Inputs"]}'),
+        ("primary_key_column",
+         "Optional field specifying which column of the first available data table should be used as a primary key.",
+         "Date"),
+        ("template_status",
+         "The current status (text) of this template.",
+         "Active"),
+        ("created_at",
+         "The timestamp of when this template was first registered.",
+         "2024-10-01 09:00:00"),
+        ("created_by",
+         "The text user ID of the person who registered this template.",
+         "data.engineer@company.com"),
+    ),
+    "inst_data_input_files": (
+        ("data_file_id",
+         "🗝️ Key: A Unique identifying number for this file.",
+         "1001"),
+        ("template_id",
+         "🔗 Linked: The text ID from the file_blueprints table.",
+         "biz_plan_q4"),
+        ("env_id",
+         "🔗 Linked: The text ID from the environment_blueprints table.",
+         "Prod.Q425_Draft"),
+        ("file_path",
+         "The full text path to the actual, physical file.",
+         "Prod.Q425_Draft/Data Inputs/Q4_Business_Plan..."),
+        ("file_hash_sha256",
+         "💎 Fingerprint: A unique hash (text) of the file's contents.",
+         "a1b2c3d4..."),
+        ("file_size_kb",
+         "The actual file size in KB (a number) for validation.",
+         "2048"),
+        ("actual_structure",
+         "A flexible JSON (text) blob of the file's actual metrics.",
+         '{"tabs": ["Summary", "Inputs"]}'),
+        ("job_status",
+         "The status (text) of the user's upload/creation.",
+         "Upload Succeeded"),
+        ("validation_status",
+         "The automated status (text) from checking the file.",
+         "Passed"),
+        ("validation_summary",
+         "A free-text summary of the validation checks.",
+         "File size and schema OK."),
+        ("current_status",
+         "⚠️ (Mutable) The workflow state (Active, Superseded, Rejected).",
+         "Active"),
+        ("created_at",
+         "The timestamp of when this log row was created.",
+         "2025-05-01 10:45:00"),
+        ("created_by",
+         'The text user ID of the person (the "Doer") who uploaded this.',
+         "sarah.j"),
+    ),
+    "inst_actuarial_model_files": (
+        ("model_file_id",
+         "🗝️ Key: A Unique identifying number for this file.",
+         "2001"),
+        ("template_id",
+         "🔗 Linked: The text ID from the file_blueprints table.",
+         "cwm_parameters"),
+        ("env_id",
+         "🔗 Linked: The text ID from the environment_blueprints table.",
+         "Prod.Q425_Draft"),
+        ("model_run_id",
+         "A text ID to group all files from the same model run.",
+         "run_abc_123"),
+        ("file_path",
+         "The full text path to the actual, physical file.",
+         "Prod.Q425_Draft/Actuarial Models/params..."),
+        ("file_hash_sha256",
+         "💎 Fingerprint: A unique hash (text) of the file's contents.",
+         "e5f6g7h8..."),
+        ("current_status",
+         "⚠️ (Mutable) The workflow state of this file.",
+         "Active"),
+        ("created_at",
+         "The timestamp of when this file was created.",
+         "2025-05-10 11:20:00"),
+        ("created_by",
+         'The text user ID of the person (the "Doer") that ran this.',
+         "actuary.user@company.com"),
+    ),
+    "inst_result_files": (
+        ("result_file_id",
+         "🗝️ Key: A Unique identifying number for this file.",
+         "3001"),
+        ("template_id",
+         "🔗 Linked: The text ID from the file_blueprints table.",
+         "validated_forecast"),
+        ("env_id",
+         "🔗 Linked: The text ID from the environment_blueprints table.",
+         "Prod.Q425_Draft"),
+        ("file_path",
+         "The full text path to the actual, physical file.",
+         "Prod.Q425_Draft/Results & Validation/validated..."),
+        ("file_hash_sha256",
+         "💎 Fingerprint: A unique hash (text) of the file's contents.",
+         "i9j0k1l2..."),
+        ("validation_status",
+         "The automated status (text) from the validation.",
+         "Passed"),
+        ("current_status",
+         "⚠️ (Mutable) The workflow state of this file.",
+         "Active"),
+        ("created_at",
+         "The timestamp of when this file was created.",
+         "2025-05-10 13:00:00"),
+        ("created_by",
+         'The text user ID of the person (the "Doer") that ran this.',
+         "bi.developer@company.com"),
+    ),
+    "inst_report_files": (
+        ("report_file_id",
+         "🗝️ Key: A Unique identifying number for this file.",
+         "4001"),
+        ("template_id",
+         "🔗 Linked: The text ID from the file_blueprints table.",
+         "exec_dashboard_data"),
+        ("env_id",
+         "🔗 Linked: The text ID from the environment_blueprints table.",
+         "Prod.Q425_Draft"),
+        ("file_path",
+         "The full text path to the actual, physical file.",
+         "Prod.Q425_Draft/Reports & Insights/exec..."),
+        ("file_hash_sha256",
+         "💎 Fingerprint: A unique hash (text) of the file's contents.",
+         "m3n4o5p6..."),
+        ("current_status",
+         "⚠️ (Mutable) The workflow state of this file.",
+         "Active"),
+        ("created_at",
+         "The timestamp of when this file was created.",
+         "2025-05-10 14:00:00"),
+        ("created_by",
+         'The text user ID of the person (the "Doer") that ran this.',
+         "bi.developer@company.com"),
+    ),
+    "gov_file_lineage": (
+        ("lineage_id",
+         "🗝️ Key: A unique ID for this link.",
+         "7001"),
+        ("parent_kind",
+         "Which file log the \"parent\" (input) file is in: 1 = data inputs, "
+         "2 = models, 3 = results, 4 = reports.",
+         "1"),
+        ("parent_id",
+         '🔗 Linked: The ID of the "parent" (input) file.',
+         "1001"),
+        ("child_kind",
+         "Which file log the \"child\" (output) file is in (same numbering).",
+         "2"),
+        ("child_id",
+         '🔗 Linked: The ID of the "child" (output) file.',
+         "2001"),
+        ("created_at",
+         "The timestamp of when this link was logged.",
+         "2025-05-10 11:20:00"),
+    ),
+    "gov_audit_trail": (
+        ("audit_log_id",
+         "🗝️ Key: A Unique identifying number for this log entry.",
+         "5001"),
+        ("timestamp",
+         "The timestamp of when the action was performed.",
+         "2025-05-10 15:00:00"),
+        ("user_id",
+         "The text user ID of the person who took the action.",
+         "jane.smith"),
+        ("action",
+         "The type of action (text): SIGN_OFF, REJECT, REVOKE, COMMENT.",
+         "SIGN_OFF"),
+        ("target_table",
+         "The text name of the table this action applies to.",
+         "inst_result_files"),
+        ("target_id",
+         "The 🔗 Linked ID of the specific row being signed off.",
+         "3001"),
+        ("signoff_capacity",
+         "The role (text) in which the person was acting.",
+         "Reviewer"),
+        ("comment",
+         "A (mandatory) free-text comment explaining the action.",
+         "Validated results against source models."),
+    ),
+    "plan_project_milestones": (
+        ("milestone_id",
+         "🗝️ Key: A Unique identifying number for this task.",
+         "101"),
+        ("env_id",
+         "🔗 Linked: The environment this task belongs to.",
+         "Prod.Q425_Draft"),
+        ("title",
+         "The text description of the task.",
+         "Final Data Review"),
+        ("duration_days",
+         "The estimated number of days this task will take.",
+         "5"),
+        ("due_date",
+         '(Nullable) The hard-coded deadline. Only set for "Final" tasks.',
+         "2025-12-20 17:00:00"),
+        ("owner_user_id",
+         "The text user ID of the person accountable for this.",
+         "sarah.j"),
+        ("status",
+         "The current status (text): Pending or Complete.",
+         "Pending"),
+        ("created_at",
+         "The timestamp of when this milestone was created.",
+         "2025-10-01 10:00:00"),
+        ("created_by",
+         "The text user ID of the person who created this.",
+         "admin@company.com"),
+        ("target_table",
+         "(Optional) The type of file that proves this is done.",
+         "bp_file_templates"),
+        ("target_id",
+         "(Optional) The ID of the file/blueprint.",
+         "exec_dashboard_data"),
+    ),
+    "plan_action_items": (
+        ("action_id",
+         "🗝️ Key: A Unique identifying number for this action.",
+         "9001"),
+        ("env_id",
+         "🔗 Linked: The environment this action relates to.",
+         "Prod.Q425_Draft"),
+        ("description",
+         "The text description of the task.",
+         "Confirm inflation assumption with Finance"),
+        ("owner_user_id",
+         "The text user ID of the person who must do this.",
+         "bob.w"),
+        ("due_date",
+         "(Optional) The timestamp of when this is due.",
+         "2025-10-03 17:00:00"),
+        ("status",
+         "The current status (text): Open or Closed.",
+         "Open"),
+        ("created_at",
+         "The timestamp of when this action was created.",
+         "2025-10-02 11:00:00"),
+        ("created_by",
+         "The text user ID of the person who logged this.",
+         "alice.j"),
+        ("target_table",
+         "(Optional) The file or milestone this action relates to.",
+         "file_blueprints"),
+        ("target_id",
+         "(Optional) The ID of the file/milestone.",
+         "cwm_parameters"),
+    ),
+    "plan_dependencies": (
+        ("task_id",
+         "🗝️🔗 Key (with predecessor_task_id) & Linked: The ID of the successor task (e.g., 'Final Report').",
+         "101"),
+        ("predecessor_task_id",
+         "🔗 Linked: The ID of the predecessor task (e.g., 'Data Gathering').",
+         "102"),
+    ),
+}
@@ -1,14 +1,22 @@
 # auth/auth_service.py
 
+import hashlib
+import hmac
+from dataclasses import dataclass
 from typing import Optional
 
 
+@dataclass(slots=True, frozen=True)
 class AuthResult:
-    def __init__(self, authenticated: bool, user: Optional[str], role: Optional[str], error: Optional[str] = None):
-        self.authenticated = authenticated
-        self.user = user
-        self.role = role
-        self.error = error
+    authenticated: bool
+    user: Optional[str]
+    role: Optional[str]
+    error: Optional[str] = None
+
+
+# Shared (immutable) results for the failure paths
+_INVALID = AuthResult(authenticated=False, user=None, role=None, error="Invalid credentials")
+_SSO_NOT_IMPL = AuthResult(authenticated=False, user=None, role=None, error="SSO mode not implemented yet")
 
 
 class AuthService:
@@ -23,32 +31,31 @@ class AuthService:
         # 'local' -> check static dict
         # 'sso'   -> call corporate SSO (future)
 
+        # The local user table is only needed in 'local' mode, so it is
+        # imported once here rather than on every login() call.
+        self._users = {}
+        if self.mode == "local":
+            from .users_local import USERS_H
+            self._users = USERS_H
+
     def login(self, username: str, password: str) -> AuthResult:
         if self.mode == "local":
-            from .users_local import USERS
-            if username in USERS and USERS[username]["password"] == password:
+            digest = hashlib.sha256(password.encode()).digest()
+            entry = self._users.get(username)
+            # Constant-time compare, so timing doesn't leak the digest
+            if entry and hmac.compare_digest(entry[0], digest):
                 return AuthResult(
                     authenticated=True,
                     user=username,
-                    role=USERS[username]["role"]
+                    role=entry[1]
                 )
             else:
-                return AuthResult(
-                    authenticated=False,
-                    user=None,
-                    role=None,
-                    error="Invalid credentials"
-                )
+                return _INVALID
 
         elif self.mode == "sso":
             # future: talk to corporate SSO / JWT / headers
             # for now we just stub it
-            return AuthResult(
-                authenticated=False,
-                user=None,
-                role=None,
-                error="SSO mode not implemented yet"
-            )
+            return _SSO_NOT_IMPL
 
         else:
             return AuthResult(
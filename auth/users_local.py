@@ -1,32 +1,41 @@
 # auth/users_local.py
+#
+# Passwords are stored as SHA-256 hex digests, never in plaintext.
+# To add a user: hashlib.sha256(b"<password>").hexdigest()
 
 USERS = {
     "#": {
-        "password": "#",
+        "password_sha256": "334359b90efed75da5f0ada1d5e6b256f4a6bd0aee7eb39c0f90182a021ffc8b",
         "role": "admin"
     },
     "arjun": {
-        "password": "test123",
+        "password_sha256": "ecd71870d1963316a97e3ac3408c9835ad8cf0f3c1bc703527c30265534f75ae",
         "role": "admin"
     },
     "dev_alex": {
-        "password": "builder",
+        "password_sha256": "df6b07176a9b17cc4c9afc257bd404732e7d09b76436c7890f7b7be14e579794",
         "role": "developer"
     },
     "cro": {
-        "password": "riskview",
+        "password_sha256": "8bb870b793ce2a8c86d7c48ab22349f9ed278d7e45dccb51cf6349a804028cc4",
         "role": "risk"
     },
     "cuo": {
-        "password": "margin",
+        "password_sha256": "34e39f662ff56641cc7349a80ede67d2ab405dc96524506d3d4df9bd5b9e01c9",
         "role": "commercial"
     },
     "ops_person": {
-        "password": "feeds",
+        "password_sha256": "eacacfab74cf6c8d5e3931653c90b5cc209f88f9ce92fc8fd30c31c113ac5072",
         "role": "inputs_admin"
     },
     "cfo_exec": {
-        "password": "boardview",
+        "password_sha256": "9029eb105cd140909be6b2d91d4a9160fbfbdfbfe7df1da9dc743c570100d4a1",
         "role": "exec"
     }
 }
+
+# Precomputed once at import: username -> (password digest bytes, role).
+USERS_H = {
+    username: (bytes.fromhex(info["password_sha256"]), info["role"])
+    for username, info in USERS.items()
+}
@@ -1,48 +1,82 @@
 # common/data_access.py
+#
+# Each getter is cached per period and returns a read-only snapshot
+# (MappingProxyType / tuple), so a caller can't mutate the shared cached
+# value. st.cache_resource is used rather than st.cache_data because
+# mappingproxy objects can't be pickled, and the values are immutable
+# anyway, so there is nothing to copy. The one exception is
+# get_visible_environments: it reads the live registry, so it is a short
+# st.cache_data that the environment manager clears on every change.
 
+from types import MappingProxyType
+
+import streamlit as st
+
+import registry_service
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_visible_environments(role: str):
+    """
+    (Cached) Environments this role can see, re-queried at most once a
+    minute. A list of dicts from the registry, so st.cache_data hands each
+    caller its own copy. Anything that creates, edits or archives an
+    environment calls get_visible_environments.clear() so the sidebar
+    picks the change up on the next run.
+    """
+    return registry_service.get_visible_environments(user_role=role)
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
 def get_scr_headline(period: str):
     """
     Return a fake SCR position for demo purposes.
     In production this would pull from certified capital results.
     """
-    return {
+    return MappingProxyType({
         "scr_amount_gbp": 92_000_000,      # £92m required capital
         "headroom_pct": 142,               # 142% coverage vs requirement
         "last_updated": "2025-09-30 10:15",
         "approved_version": "v1.3"
-    }
+    })
+
 
+@st.cache_resource(ttl=300, show_spinner=False)
 def get_loss_ratio_summary(period: str):
     """
     Return a fake loss ratio for demo purposes.
     In production this would come from Underwriting Results / finance sign-off.
     """
-    return {
+    return MappingProxyType({
         "loss_ratio_pct": 43.0,            # combined loss ratio
         "movement_vs_last_month_pp": +1.2, # percentage point movement
         "last_updated": "2025-09-30 09:02",
         "approved_version": "v1.3"
-    }
+    })
 
+
+@st.cache_resource(ttl=300, show_spinner=False)
 def get_ops_metrics(period: str):
     """
     Return basic operational pressure metrics (dummy).
     This would come from service/ops data feeds in Inputs.
     """
-    return {
+    return MappingProxyType({
         "avg_wait_time_days": 2.1,
         "delta_wait_time_vs_last_month_days": -0.3,
         "repeat_visit_rate_pct": 8.0,
         "last_updated": "2025-09-30 08:40"
-    }
+    })
+
 
+@st.cache_resource(ttl=300, show_spinner=False)
 def get_top_actions(period: str):
     """
     Example AI-style summary of 'what to do' this cycle.
     In production this could be LLM-generated from validated inputs.
     """
-    return [
+    return (
         "Increase engineering capacity in North region to protect wait times.",
         "Reprice high-deterioration segment in Plumbing cover.",
-        "Escalate cold-weather exposure scenario to CRO: capital impact up £0.75m under stress."
-    ]
+        "Escalate cold-weather exposure scenario to CRO: capital impact up £0.75m under stress.",
+    )
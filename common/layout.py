@@ -13,45 +13,12 @@ v4 Changes:
 
 from typing import Optional, Any, Callable
 import streamlit as st
-import base64  # To embed the logo
-
-@st.cache_data
-def get_image_as_base64(path):
-    """Caches and loads a local image as a base64 string."""
-    try:
-        with open(path, "rb") as f:
-            data = f.read()
-        return base64.b64encode(data).decode()
-    except Exception as e:
-        st.error(f"Could not load logo: {e}")
-        return None
 
-def render_frame(
-    title_override: str,
-    body_component: Optional[Callable],
-    last_updated: str,
-    owner: str,
-    data_source: str,
-    coming_soon: bool = False,
-    environment: Optional[str] = None,
-) -> None:
-    """
-    Render the Pulse header strip for the current dashboard.
-
-    This version uses custom HTML/CSS for an ultra-thin, rich header.
-    """
-
-    # --- 1. Load Assets ---
-    logo_base64 = get_image_as_base64("favicon.ico")
-    logo_html = f'<img src="data:image/png;base64,{logo_base64}" class="header-logo">' \
-        if logo_base64 else "🩺"
-
-    env_badge = f'<span class="env-badge">{environment}</span>' if environment else ""
-    coming_soon_tag = '<span class="coming-soon-badge">⚠ Coming Soon</span>' if coming_soon else ""
-
-    # --- 2. Define the CSS (Embedded) ---
-    header_css = """
-<style>
+# --- Header CSS (Embedded, static) ---
+# One <style> element with a stable id. Streamlit replaces it in place on
+# each rerun (elements are diffed by position), so it never stacks up.
+_HEADER_CSS = """
+<style id="pulse-header-css">
     /* Removes top padding from the main container */
     div.block-container {
         padding-top: 1.8rem !important; 
@@ -65,8 +32,6 @@ def render_frame(
         padding: 0.3rem 1.25rem; /* 5px top/bottom, 20px left/right */
         
         /* Visuals */
-        background-image: linear-gradient(90deg, #00416A, #E4E5E6);
-        background-image: linear-gradient(90deg, #4B9FFF, #FFFFFF);
         background-image: linear-gradient(90deg, #000000, #4B9FFF);
         border-radius: 10px;
         box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
@@ -138,9 +103,24 @@ def render_frame(
 </style>
 """
 
-    # --- 3. Define the HTML (Un-indented) ---
-#{logo_html}
-    header_html = f"""
+
+@st.cache_data(show_spinner=False)
+def _build_header_html(
+    title_override: str,
+    last_updated: str,
+    owner: str,
+    data_source: str,
+    coming_soon: bool,
+    environment: Optional[str],
+) -> str:
+    """
+    Builds the header bar HTML. Cached, as it only depends on its args.
+    """
+    env_badge = f'<span class="env-badge">{environment}</span>' if environment else ""
+    coming_soon_tag = '<span class="coming-soon-badge">⚠ Coming Soon</span>' if coming_soon else ""
+
+    # --- Define the HTML (Un-indented) ---
+    return f"""
 <div class="pulse-header">
 <div class="header-left">
 <img src="https://media2.giphy.com/media/v1.Y2lkPTc5MGI3NjExdHgwcXp4eG11M21jNXp5YjM5YW1uZXh3a24xcXN2czBzZnAycW5obiZlcD12MV9pbnRlcm5hbF9naWZfYnlfaWQmY3Q9Zw/kfLxX6jUuFTZMMQEvK/giphy.gif" class="header-gif" alt="Pulse GIF">
@@ -167,12 +147,34 @@ def render_frame(
 </div>
 """
 
-    # --- 4. Render CSS and HTML ---
-    st.markdown(header_css, unsafe_allow_html=True)
+
+def render_frame(
+    title_override: str,
+    body_component: Optional[Callable],
+    last_updated: str,
+    owner: str,
+    data_source: str,
+    coming_soon: bool = False,
+    environment: Optional[str] = None,
+) -> None:
+    """
+    Render the Pulse header strip for the current dashboard.
+
+    This version uses custom HTML/CSS for an ultra-thin, rich header.
+    """
+
+    # --- 1. Build the HTML (cached per header content) ---
+    header_html = _build_header_html(
+        title_override, last_updated, owner, data_source, coming_soon,
+        environment,
+    )
+
+    # --- 2. Render CSS and HTML ---
+    st.html(_HEADER_CSS)  # Style-only, so it takes no layout space
     st.markdown(header_html, unsafe_allow_html=True)
 
 
-    # --- 5. Render Page Content ---
+    # --- 3. Render Page Content ---
     # This logic remains the same as before.
 
     if coming_soon:
@@ -1,5 +1,7 @@
 # config.py
 
+from types import MappingProxyType
+
 # Which pages exist in Pulse.
 # Each section has pages. Each page maps to a module.
 ALL_PAGES = {
@@ -170,6 +172,20 @@ ALL_PAGES = {
 
 }
 
+# Freeze each page's roles so "role in allowed_roles" is an O(1) lookup.
+for _pages in ALL_PAGES.values():
+    for _page in _pages.values():
+        _page["allowed_roles"] = frozenset(_page["allowed_roles"])
+
+# Role -> the part of ALL_PAGES that role can see (same nested shape and
+# order), built once here instead of filtering ALL_PAGES on every rerun.
+PAGES_BY_ROLE = {}
+for _section, _pages in ALL_PAGES.items():
+    for _label, _page in _pages.items():
+        for _role in _page["allowed_roles"]:
+            PAGES_BY_ROLE.setdefault(_role, {}).setdefault(_section, {})[_label] = _page
+del _section, _pages, _label, _page, _role
+
 # Sidebar icons for each section
 SECTION_ICONS = {
     "Home":                  "🏡",
@@ -180,3 +196,13 @@ SECTION_ICONS = {
     "Admin Panel":           "🗃️",
     "Documentation":         "📚"
 }
+
+# Frame metadata for pages that can't render (read-only, shared). Neither
+# sets "title_override", so the frame falls back to the page's own label.
+COMING_SOON_META = MappingProxyType({
+    "last_updated": "N/A",
+    "owner": "TBD",
+    "data_source": "N/A",
+    "coming_soon": True,
+})
+PAGE_ERROR_META = MappingProxyType({"title_override": "Page Error"})
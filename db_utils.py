@@ -15,7 +15,8 @@ rerunning `registry_schema.py` when you have data you want to keep.
 -------------------------------------------------------------------------------
 This script makes *PERMANENT* changes to your database.
 Deleting or renaming columns is a complex operation. This script will
-*GENERATE* the SQL for you, but you must run it manually.
+*GENERATE* the SQL for you (a native `ALTER TABLE`), and only runs it if
+you set `APPLY_MIGRATION`.
 
 -------------------------------------------------------------------------------
 HOW TO USE THIS SCRIPT:
@@ -31,11 +32,15 @@ HOW TO USE THIS SCRIPT:
 SUPPORTED ACTIONS:
 -------------------------------------------------------------------------------
 - 'LIST_TABLES': (Safe) Shows all 10 tables in the database.
-- 'GET_TABLE_INFO': (Safe) Shows all columns, types, and row count for one table.
+- 'GET_TABLE_INFO': (Safe) Shows all columns, types, and row count for one table
+  (estimated from ANALYZE stats unless `EXACT_ROW_COUNT` is set).
 - 'ADD_TABLE': (Safe) Runs the `NEW_TABLE_SQL` string.
 - 'ADD_COLUMN': (Safe) Adds a new column to an existing table.
-- 'RENAME_COLUMN': (DANGEROUS) Prints the *manual* SQL steps you must take.
-- 'DELETE_COLUMN': (DANGEROUS) Prints the *manual* SQL steps you must take.
+- 'RENAME_COLUMN': (DANGEROUS) Prints the `ALTER TABLE ... RENAME COLUMN`
+  (or runs it if `APPLY_MIGRATION` is True). Needs SQLite 3.25+.
+- 'DELETE_COLUMN': (DANGEROUS) Prints the `ALTER TABLE ... DROP COLUMN`
+  (or runs it if `APPLY_MIGRATION` is True). Needs SQLite 3.35+.
+  (On an older SQLite, both only print a manual rebuild, never run it.)
 """
 
 import sqlite3
@@ -43,8 +48,8 @@ import os
 
 # --- [1] CONFIGURATION (EDIT THIS SECTION) ---
 
-# The database file to modify
-DB_FILE = "atlas_registry.db"
+# The database file to modify (defaults to the ATLAS_REGISTRY_DB env var, if set)
+DB_FILE = os.environ.get("ATLAS_REGISTRY_DB", "atlas_registry.db")
 
 # The action you want to perform.
 # Options: "LIST_TABLES", "GET_TABLE_INFO", "ADD_COLUMN", "RENAME_COLUMN", "DELETE_COLUMN", "ADD_TABLE"
@@ -53,6 +58,11 @@ ACTION = "ADD_COLUMN"
 # The name of the table you want to interact with
 TABLE_NAME = "inst_actuarial_model_files"
 
+# --- For "GET_TABLE_INFO" ---
+# False: use the row estimate from `sqlite_stat1` (kept by ANALYZE) when there
+# is one, instead of a full-table COUNT(*). True: always count exactly.
+EXACT_ROW_COUNT = False
+
 # --- For "ADD_COLUMN" ---
 COLUMN_NAME = "job_status"
 COLUMN_TYPE = "TEXT"  # e.g., "TEXT", "INTEGER", "DATETIME", "TEXT DEFAULT 'Pending'"
@@ -64,6 +74,11 @@ NEW_COLUMN_NAME = "source_name"
 # --- For "DELETE_COLUMN" ---
 COLUMN_TO_DELETE = "start_date"
 
+# --- For "RENAME_COLUMN" / "DELETE_COLUMN" ---
+# False (default): only print the migration SQL for you to run by hand.
+# True: run the native ALTER TABLE (SQLite 3.25+ / 3.35+). BACK UP FIRST.
+APPLY_MIGRATION = False
+
 # --- For "ADD_TABLE" ---
 # Paste your new 'CREATE TABLE IF NOT EXISTS...' string here.
 NEW_TABLE_SQL = """
@@ -76,16 +91,32 @@ CREATE TABLE IF NOT EXISTS my_new_table (
 
 # --- [2] THE "ENGINE" (DO NOT EDIT BELOW THIS LINE) ---
 
+# Column positions in a `PRAGMA table_info` row
+_CID, _NAME, _TYPE, _NOTNULL, _DFLT, _PK = range(6)
+
+
+def _q(ident):
+    """(Internal) Quotes an SQL identifier, so reserved words (e.g. `order`) and odd names are safe."""
+    return '"' + ident.replace('"', '""') + '"'
+
+
 def get_db_conn():
-    """Connects to the database and enables foreign keys."""
+    """Connects to the database (WAL, relaxed sync) and enables foreign keys."""
     if not os.path.exists(DB_FILE):
         print(f"Error: Database file not found at '{DB_FILE}'")
         print("Please run `registry_schema.py` first to create the database.")
         return None
 
-    conn = sqlite3.connect(DB_FILE)
+    # isolation_level=None: no implicit transactions. The write actions
+    # below open and close their own with BEGIN / COMMIT.
+    conn = sqlite3.connect(DB_FILE, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -20000;")    # ~20MB page cache
+    conn.execute("PRAGMA mmap_size = 268435456;")  # 256MB memory-mapped reads
     conn.execute("PRAGMA foreign_keys = ON;")
-    conn.row_factory = sqlite3.Row
+    # No row_factory: rows are plain tuples, read by index (see _NAME etc.)
     return conn
 
 
@@ -93,14 +124,18 @@ def list_tables(conn):
     """(Safe) Prints all tables in the database."""
     print(f"--- Tables in {DB_FILE} ---")
     cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = [row['name'] for row in cursor.fetchall()]
+    tables = [name for (name,) in cursor]
     for table in tables:
         if not table.startswith("sqlite_"):
             print(f"- {table}")
 
 
-def get_table_info(conn, table_name):
-    """(Safe) Prints all columns, types, and row count for one table."""
+def get_table_info(conn, table_name, exact=False):
+    """
+    (Safe) Prints all columns, types, and row count for one table.
+    Unless `exact` is set, the row count is taken from `sqlite_stat1` when
+    ANALYZE has been run, and only falls back to a COUNT(*) scan otherwise.
+    """
     print(f"--- Info for table: {table_name} ---")
 
     # Check if table exists
@@ -111,99 +146,166 @@ def get_table_info(conn, table_name):
 
     # Get Column Info
     print("\n[Columns]:")
-    cursor = conn.execute(f"PRAGMA table_info({table_name});")
-    columns = cursor.fetchall()
-    for col in columns:
-        print(f"  - Name: {col['name']}, Type: {col['type']}, NotNull: {col['notnull']}, PK: {col['pk']}")
+    cursor = conn.execute(f"PRAGMA table_info({_q(table_name)});")
+    for col in cursor:
+        print(f"  - Name: {col[_NAME]}, Type: {col[_TYPE]}, NotNull: {col[_NOTNULL]}, PK: {col[_PK]}")
 
     # Get Row Count
-    cursor = conn.execute(f"SELECT COUNT(*) FROM {table_name};")
-    count = cursor.fetchone()[0]
-    print(f"\n[Row Count]: {count} rows")
+    estimate = None if exact else _estimated_row_count(conn, table_name)
+    if estimate is not None:
+        print(f"\n[Row Count]: ~{estimate} rows (estimated, from sqlite_stat1)")
+    else:
+        cursor = conn.execute(f"SELECT COUNT(*) FROM {_q(table_name)};")
+        count = cursor.fetchone()[0]
+        print(f"\n[Row Count]: {count} rows (exact)")
+
+
+def _estimated_row_count(conn, table_name):
+    """
+    (Internal) Row count recorded for a table by the last ANALYZE, or None
+    if there isn't one. The first number of each `stat` entry is the row
+    count; the whole-table entry (idx IS NULL) is preferred when present.
+    """
+    try:
+        row = conn.execute(
+            "SELECT stat FROM sqlite_stat1 WHERE tbl = ? ORDER BY idx IS NOT NULL LIMIT 1;",
+            (table_name,),
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None  # ANALYZE has never been run (no sqlite_stat1 table)
+    return int(row[0].split()[0]) if row else None
 
 
 def add_new_column(conn, table_name, col_name, col_type):
     """(Safe) Adds a new column to an existing table."""
     print(f"Attempting to ADD column '{col_name} ({col_type})' to table '{table_name}'...")
     try:
-        conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_type};")
-        conn.commit()
+        conn.execute("BEGIN IMMEDIATE;")
+        conn.execute(f"ALTER TABLE {_q(table_name)} ADD COLUMN {_q(col_name)} {col_type};")
+        conn.execute("COMMIT;")
         print(f"Success! Column '{col_name}' added to '{table_name}'.")
         get_table_info(conn, table_name)
     except Exception as e:
         print(f"\n!!! --- ERROR --- !!!\n{e}")
         print("This often happens if the column *already exists*.")
-        conn.rollback()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK;")
 
 
 def create_new_table(conn, sql_string):
     """(Safe) Adds a new table to the database."""
     print("Attempting to ADD new table...")
     try:
+        conn.execute("BEGIN IMMEDIATE;")
         conn.execute(sql_string)
-        conn.commit()
+        conn.execute("COMMIT;")
         print("Success! New table created.")
         list_tables(conn)
     except Exception as e:
         print(f"\n!!! --- ERROR --- !!!\n{e}")
-        conn.rollback()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK;")
 
 
 def _get_column_list(conn, table_name, exclude_col=None, rename_map=None):
-    """(Internal) Helper to get a comma-separated list of columns."""
-    cursor = conn.execute(f"PRAGMA table_info({table_name});")
-    columns = [row['name'] for row in cursor.fetchall()]
-
-    if exclude_col:
-        columns = [col for col in columns if col != exclude_col]
-
+    """
+    (Internal) Helper to get a comma-separated list of quoted columns.
+    The exclude, rename and quoting are done by SQLite, via pragma_table_info()
+    (printf's %w doubles any embedded double quotes, the same as `_q`).
+    """
+    rename_map = rename_map or {}
+    projection = """printf('"%w"', name)"""
+    params = []
     if rename_map:
         # For renaming, we create the "AS" list
-        columns = [f"{col} AS {rename_map[col]}" if col in rename_map else col for col in columns]
-
-    return ", ".join(columns)
-
-
-def print_migration_warning(conn, table_name, old_col, new_col, action):
+        whens = " ".join(f"WHEN ? THEN {projection} || ' AS ' || ?" for _ in rename_map)
+        projection = f"CASE name {whens} ELSE {projection} END"
+        for old, new in rename_map.items():
+            params += [old, _q(new)]
+
+    cursor = conn.execute(
+        f"SELECT {projection} FROM pragma_table_info(?) WHERE name IS NOT ? ORDER BY cid;",
+        (*params, table_name, exclude_col),
+    )
+    return ", ".join(row[0] for row in cursor)
+
+
+# Native, in-place column changes. Unlike a copy/drop/rename of the table,
+# these keep its PRIMARY KEY, AUTOINCREMENT, constraints, defaults,
+# foreign keys, indexes and triggers (SQLite rewrites any that mention a
+# renamed column, and refuses to DROP a column that one of them still uses).
+_ALTER_SQL = {
+    "RENAME_COLUMN": "ALTER TABLE {table} RENAME COLUMN {old} TO {new};",
+    "DELETE_COLUMN": "ALTER TABLE {table} DROP COLUMN {old};",
+}
+_ALTER_MIN_SQLITE = {"RENAME_COLUMN": (3, 25, 0), "DELETE_COLUMN": (3, 35, 0)}
+
+# Fallback for older SQLite: rebuild by hand. `CREATE TABLE ... AS SELECT`
+# does NOT copy keys, constraints, defaults, indexes or triggers, so this is
+# only ever printed (as a starting point), never run by this script.
+_MIGRATION_SQL = """PRAGMA foreign_keys=OFF;
+BEGIN IMMEDIATE;
+CREATE TABLE {temp} AS SELECT {cols} FROM {table};
+DROP TABLE {table};
+ALTER TABLE {temp} RENAME TO {table};
+COMMIT;
+PRAGMA foreign_keys=ON;"""
+
+
+def _migration_sql(table_name, select_cols):
+    """(Internal) The 7-step copy/drop/rename script, as one SQL string."""
+    return _MIGRATION_SQL.format(temp=_q(f"temp_{table_name}"), cols=select_cols, table=_q(table_name))
+
+
+def print_migration_warning(conn, table_name, old_col, new_col, action, apply=False):
     """
-    (DANGEROUS - READ-ONLY)
-    Prints the safe 7-step SQL for renaming or deleting a column.
+    (DANGEROUS - READ-ONLY unless `apply` is set)
+    Prints the SQL for renaming or deleting a column: a single native
+    ALTER TABLE where this SQLite supports it, which `apply=True` then runs.
+    On an older SQLite it prints the manual 7-step rebuild, and never runs it.
     """
     if action == "RENAME_COLUMN":
         print(f"--- WARNING: Renaming a Column in SQLite is a Destructive Operation ---")
-        print("This script will NOT perform the action. You must do it manually.")
-        print(f"Below are the *safe* SQL commands to rename '{old_col}' to '{new_col}' on table '{table_name}':\n")
-
-        # We must map the old name to the new name
-        cols_with_rename = _get_column_list(conn, table_name, rename_map={old_col: new_col})
-
-        print(f"--- [Start SQL] Run these 7 commands in a DB tool ---")
-        print("PRAGMA foreign_keys=OFF;")
-        print("BEGIN TRANSACTION;")
-        print(f"CREATE TABLE temp_{table_name} AS SELECT {cols_with_rename} FROM {table_name};")
-        print(f"DROP TABLE {table_name};")
-        print(f"ALTER TABLE temp_{table_name} RENAME TO {table_name};")
-        print("COMMIT;")
-        print("PRAGMA foreign_keys=ON;")
-        print(f"--- [End SQL] ---")
-
+        print(f"Below is the SQL to rename '{old_col}' to '{new_col}' on table '{table_name}':\n")
     elif action == "DELETE_COLUMN":
         print(f"--- WARNING: Deleting a Column in SQLite is a Destructive Operation ---")
-        print("This script will NOT perform the action. You must do it manually.")
-        print(f"Below are the *safe* SQL commands to delete '{old_col}' from table '{table_name}':\n")
-
-        # We must get the list of all *other* columns
-        cols_to_keep = _get_column_list(conn, table_name, exclude_col=old_col)
-
-        print(f"--- [Start SQL] Run these 7 commands in a DB tool ---")
-        print("PRAGMA foreign_keys=OFF;")
-        print("BEGIN TRANSACTION;")
-        print(f"CREATE TABLE temp_{table_name} AS SELECT {cols_to_keep} FROM {table_name};")
-        print(f"DROP TABLE {table_name};")
-        print(f"ALTER TABLE temp_{table_name} RENAME TO {table_name};")
-        print("COMMIT;")
-        print("PRAGMA foreign_keys=ON;")
+        print(f"Below is the SQL to delete '{old_col}' from table '{table_name}':\n")
+    else:
+        return
+
+    if sqlite3.sqlite_version_info < _ALTER_MIN_SQLITE[action]:
+        # We must map the old name to the new name, or list all *other* columns
+        if action == "RENAME_COLUMN":
+            select_cols = _get_column_list(conn, table_name, rename_map={old_col: new_col})
+        else:
+            select_cols = _get_column_list(conn, table_name, exclude_col=old_col)
+        print(f"--- [Start SQL] SQLite {sqlite3.sqlite_version} has no native {action}: a manual rebuild ---")
+        print(_migration_sql(table_name, select_cols))
         print(f"--- [End SQL] ---")
+        print("\nThis does NOT keep the table's keys, constraints, defaults, indexes or triggers:")
+        print("edit the CREATE TABLE to match the original (see sqlite_master) before running it,")
+        print("and re-run registry_schema.py afterwards. This script will not run it for you.")
+        return
+
+    sql = _ALTER_SQL[action].format(table=_q(table_name), old=_q(old_col), new=_q(new_col or ""))
+    print(f"--- [Start SQL] ---")
+    print(sql)
+    print(f"--- [End SQL] ---")
+
+    if not apply:
+        print("\nThis script did NOT perform the action. Run the SQL above manually,")
+        print("or set APPLY_MIGRATION = True to have this script run it for you.")
+        return
+
+    print("\nAPPLY_MIGRATION is set: running the SQL above...")
+    try:
+        conn.execute(sql)
+        conn.commit()
+        print(f"Success! Table '{table_name}' migrated.")
+    except Exception as e:
+        print(f"\n!!! --- ERROR --- !!!\n{e}")
+        if conn.in_transaction:
+            conn.rollback()
 
 
 # --- [3] MAIN SCRIPT "ROUTER" ---
@@ -226,7 +328,7 @@ def main():
             if not TABLE_NAME:
                 print("Error: You must set TABLE_NAME for this action.")
                 return
-            get_table_info(conn, TABLE_NAME)
+            get_table_info(conn, TABLE_NAME, exact=EXACT_ROW_COUNT)
 
         # --- (Safe) Write Actions ---
         elif ACTION == "ADD_COLUMN":
@@ -238,18 +340,20 @@ def main():
         elif ACTION == "ADD_TABLE":
             create_new_table(conn, NEW_TABLE_SQL)
 
-        # --- (Dangerous) Guided Read-Only Actions ---
+        # --- (Dangerous) Guided Actions (read-only unless APPLY_MIGRATION) ---
         elif ACTION == "RENAME_COLUMN":
             if not all([TABLE_NAME, OLD_COLUMN_NAME, NEW_COLUMN_NAME]):
                 print("Error: You must set TABLE_NAME, OLD_COLUMN_NAME, and NEW_COLUMN_NAME.")
                 return
-            print_migration_warning(conn, TABLE_NAME, OLD_COLUMN_NAME, NEW_COLUMN_NAME, "RENAME_COLUMN")
+            print_migration_warning(conn, TABLE_NAME, OLD_COLUMN_NAME, NEW_COLUMN_NAME, "RENAME_COLUMN",
+                                    apply=APPLY_MIGRATION)
 
         elif ACTION == "DELETE_COLUMN":
             if not all([TABLE_NAME, COLUMN_TO_DELETE]):
                 print("Error: You must set TABLE_NAME and COLUMN_TO_DELETE.")
                 return
-            print_migration_warning(conn, TABLE_NAME, COLUMN_TO_DELETE, None, "DELETE_COLUMN")
+            print_migration_warning(conn, TABLE_NAME, COLUMN_TO_DELETE, None, "DELETE_COLUMN",
+                                    apply=APPLY_MIGRATION)
 
         else:
             print(f"Error: Unknown ACTION: '{ACTION}'")
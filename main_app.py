@@ -1,15 +1,16 @@
 import streamlit as st
 import importlib
+import sys
 import registry_service
 
 from auth.auth_service import AuthService
+from common.data_access import get_visible_environments
 from common.layout import render_frame
 
-from config import ALL_PAGES, SECTION_ICONS
+from config import PAGES_BY_ROLE, SECTION_ICONS, COMING_SOON_META, PAGE_ERROR_META
 from security import (
     get_user_session,
     ensure_logged_in,
-    get_allowed_pages_for_role,
 )
 from ui_nav import build_sidebar
 
@@ -23,14 +24,14 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
-@st.cache_data
-def load_css(file_path):
-    with open(file_path) as f:
-        return f.read()
+@st.cache_resource(show_spinner=False)
+def _css_block(file_path):
+    """Read a stylesheet once per process, already wrapped in <style> tags."""
+    with open(file_path, "rb") as f:
+        return f"<style>{f.read().decode('utf-8')}</style>"
 
 # --- In your main script ---
-css = load_css("style.css")
-st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+st.markdown(_css_block("style.css"), unsafe_allow_html=True)
 # st.markdown("""
 #     <style>
 #       .block-container { padding:2rem 4rem !important; }
@@ -38,9 +39,28 @@ st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 #     </style>
 # """, unsafe_allow_html=True)
 
+@st.cache_resource(show_spinner=False)
+def _get_page_module(module_path):
+    """Import apps.<module_path> once per process. A failed import
+    raises out of the cache, so it is not memoized."""
+    return importlib.import_module(f"apps.{module_path}")
+
+
+def _forget_page_module(module_path):
+    """Drop a page that could not be found, so the next run retries it."""
+    sys.modules.pop(f"apps.{module_path}", None)
+    _get_page_module.clear()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_auth(mode="local"):
+    """One AuthService per process; it holds no per-user state."""
+    return AuthService(mode=mode)
+
+
 # 1. Auth / session ---------------------------------
 session = get_user_session()
-auth = AuthService(mode="local")
+auth = _get_auth()
 
 # if not session["authenticated"]:
 #     ensure_logged_in(auth)  # will render login form or set session
@@ -51,20 +71,22 @@ user = session["user"]
 
 
 # 2. Figure out what this role can see ----------------
-allowed_envs = registry_service.get_visible_environments(user_role=role)
-allowed_pages = get_allowed_pages_for_role(role, ALL_PAGES)
+allowed_envs = get_visible_environments(role)
+allowed_pages = PAGES_BY_ROLE.get(role, {})  # Precomputed per role in config
 
 if not allowed_pages:
     st.error("Your role does not have access to any dashboards in Atlas.")
     st.stop()
 
 # We must initialize the 'environment' in session state here.
-# Get the list of all valid environment IDs
+# Get the list of all valid environment IDs (ordered, for the default)
+# and a set of them for the membership check
 all_allowed_env_ids = [env['env_id'] for env in allowed_envs]
+env_id_set = frozenset(all_allowed_env_ids)
 
 # Check if state is uninitialized OR if the current env is no longer valid
 if ("environment" not in st.session_state
-        or st.session_state["environment"] not in all_allowed_env_ids):
+        or st.session_state["environment"] not in env_id_set):
 
     # Set a new, valid default.
     # If the list is NOT empty, set to the first item.
@@ -84,7 +106,8 @@ nav_state = build_sidebar(
 )
 
 if nav_state["logout"]:
-    # wipe session & rerun
+    # wipe session & cached env list, then rerun
+    get_visible_environments.clear()
     st.session_state.clear()
     st.rerun()
 
@@ -96,27 +119,22 @@ environment = nav_state["environment"]
 module_path = allowed_pages[active_section][active_page_label]["module"]
 
 try:
-    module = importlib.import_module(f"apps.{module_path}")
+    module = _get_page_module(module_path)
     body_component, meta = module.render_page(
         role=role,
         environment=environment
     )
 except ModuleNotFoundError:
     # "Coming soon" placeholder
+    _forget_page_module(module_path)
     body_component = None
-    meta = {
-        "title_override": active_page_label,
-        "last_updated": "N/A",
-        "owner": "TBD",
-        "data_source": "N/A",
-        "coming_soon": True
-    }
+    meta = COMING_SOON_META  # title falls back to active_page_label below
 except Exception as e:
     # Catch any other error from within the page module
     st.error(f"An error occurred while rendering '{active_page_label}'.")
     st.exception(e) # Show the full traceback for debugging
     body_component = None
-    meta = { "title_override": "Page Error" } # etc.
+    meta = PAGE_ERROR_META
 
 # 5. Wrap it in the Pulse frame -----------------------
 render_frame(
@@ -23,6 +23,7 @@ Use your editor's search function (Ctrl+F) to find these tags:
 
 [S1]  SECTION 1: THE "BLUEPRINTS" (The Catalogs)
 [T1]    - bp_environments:      The "Project" catalog
+[T1b]   - bp_environment_roles: Which roles can see each environment (trigger-maintained)
 [T2]    - bp_file_templates:    The "Data" catalog (rules for files)
 
 [S2]  SECTION 2: THE "FILE LOGS" (The Instances)
@@ -39,9 +40,10 @@ Use your editor's search function (Ctrl+F) to find these tags:
 [T9]    - plan_project_milestones:  The "Big Deadlines"
 [T10]   - plan_action_items:        The "To-Do List"
 [T11]   - plan_dependencies:        The "Dependency Links"
+[T12]   - env_stats:                Running per-environment counts (trigger-maintained)
 
 [S5]  SECTION 5: THE "INDEXES" (Performance)
-[I1] - [I10] Indexes to make the database fast
+[I1] - [I12] Indexes to make the database fast
 
 [INIT]  initialize_database(): The main function that runs everything
 
@@ -80,11 +82,31 @@ the "story" of our data governance process.
 -------------------------------------------------------------------------------
 """
 
+import os
 import sqlite3
 import sys
+from pathlib import Path
 
 # The name of the database file that will be created
-DB_FILE = "atlas_registry.db"
+# (override with the ATLAS_REGISTRY_DB environment variable)
+DB_FILE = os.environ.get("ATLAS_REGISTRY_DB", "atlas_registry.db")
+
+
+def open_rw(db_file=None, **kwargs):
+    """
+    Opens a normal (read/write) connection to the registry. db_file
+    defaults to DB_FILE, read at call time (so repointing it is honoured).
+    """
+    return sqlite3.connect(db_file or DB_FILE, **kwargs)
+
+
+def open_ro(db_file=None, **kwargs):
+    """
+    Opens a read-only connection to the registry (db_file defaults to
+    DB_FILE, read at call time). It can never write or take the write
+    lock, and it won't create the file if it is missing.
+    """
+    return sqlite3.connect(f"{Path(db_file or DB_FILE).resolve().as_uri()}?mode=ro", uri=True, **kwargs)
 
 
 # --- [S1] SECTION 1: THE "BLUEPRINTS" (DEFINITION TABLES) ---
@@ -112,6 +134,48 @@ CREATE TABLE IF NOT EXISTS bp_environments (
 );
 """
 
+# --- [T1b] bp_environment_roles (Who Can See Each Environment) ------
+# PURPOSE: One row per (role, environment) from [T1]'s comma-separated
+#          `allowed_roles`, so "which envs can this role see?" is an index
+#          seek on the primary key rather than a substring scan of every row.
+# NOTE:    Nothing writes to it directly: the triggers below rebuild an
+#          env's rows whenever `allowed_roles` is written, and
+#          `initialize_database()` rebuilds it all (REFRESH_ENV_ROLES).
+# ------------------------------------------------------------------
+CREATE_ENV_ROLES = """
+CREATE TABLE IF NOT EXISTS bp_environment_roles (
+    role TEXT NOT NULL,
+    env_id TEXT NOT NULL,
+
+    PRIMARY KEY (role, env_id),
+    FOREIGN KEY (env_id) REFERENCES bp_environments (env_id) ON DELETE CASCADE
+) WITHOUT ROWID;
+"""
+
+# 'a,b,c' -> the rows 'a', 'b', 'c' (as a JSON array; CTEs aren't allowed in triggers)
+_SPLIT_ROLES_SQL = """json_each('["' || replace({col}, ',', '","') || '"]')"""
+
+CREATE_ENV_ROLES_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS trg_bp_environments_roles_ins AFTER INSERT ON bp_environments
+BEGIN
+    INSERT OR IGNORE INTO bp_environment_roles (role, env_id)
+    SELECT value, NEW.env_id FROM {_SPLIT_ROLES_SQL.format(col="NEW.allowed_roles")};
+END;
+CREATE TRIGGER IF NOT EXISTS trg_bp_environments_roles_upd AFTER UPDATE OF allowed_roles ON bp_environments
+BEGIN
+    DELETE FROM bp_environment_roles WHERE env_id = NEW.env_id;
+    INSERT OR IGNORE INTO bp_environment_roles (role, env_id)
+    SELECT value, NEW.env_id FROM {_SPLIT_ROLES_SQL.format(col="NEW.allowed_roles")};
+END;
+"""
+
+REFRESH_ENV_ROLES = f"""
+DELETE FROM bp_environment_roles;
+INSERT OR IGNORE INTO bp_environment_roles (role, env_id)
+SELECT R.value, E.env_id
+FROM bp_environments AS E, {_SPLIT_ROLES_SQL.format(col="E.allowed_roles")} AS R;
+"""
+
 # --- [T2] bp_file_templates (The "Data" Catalog) -------------------
 # PURPOSE: Defines the rules for a *type* of file (e.g., "Finance Plan").
 #          It specifies owners, sensitivity, and validation rules.
@@ -227,7 +291,6 @@ CREATE TABLE IF NOT EXISTS inst_actuarial_model_files (
     -- Status
     current_status TEXT DEFAULT 'Active',
     validation_summary TEXT,
-    validation_summary TEXT,
     job_status TEXT,
     
     -- Audit
@@ -301,28 +364,107 @@ CREATE TABLE IF NOT EXISTS inst_report_files (
 # --- [T7] gov_file_lineage (The "Recipe" Log) ----------------------
 # PURPOSE: Creates the "recipe" of how files are made. It links
 #          "parent" files (inputs) to "child" files (outputs).
-# EXAMPLE: (1, 'inst_data_input_files', '1', 'inst_result_files', '1')
+# EXAMPLE: (1, 1, 1, 3, 1)
 #          This means: "Data file #1 was used to create Result file #1"
 # LINKS:   - This is a "polymorphic" table. It can link ANY file in
 #          - [T3-T6] to any other file in [T3-T6].
-#          - We use TEXT for IDs to be consistent with [T8].
+#          - Each end is a small integer "kind" (which file log, see
+#            LINEAGE_KINDS) plus that log's INTEGER file ID. This keeps the
+#            index keys small and the comparisons integer-only.
+#          - The gov_file_lineage_named view adds the table names back.
 # ------------------------------------------------------------------
+
+# The "kind" number stored for each file log table [T3-T6]
+LINEAGE_KINDS = {
+    'inst_data_input_files':      1,
+    'inst_actuarial_model_files': 2,
+    'inst_result_files':          3,
+    'inst_report_files':          4,
+}
+
 CREATE_FILE_LINEAGE = """
 CREATE TABLE IF NOT EXISTS gov_file_lineage (
     lineage_id INTEGER PRIMARY KEY AUTOINCREMENT,
     
     -- The "Parent" file (the input)
-    parent_table TEXT NOT NULL,
-    parent_id TEXT NOT NULL,
+    parent_kind INTEGER NOT NULL CHECK (parent_kind BETWEEN 1 AND 4),
+    parent_id INTEGER NOT NULL,
     
     -- The "Child" file (the output that was made)
-    child_table TEXT NOT NULL,
-    child_id TEXT NOT NULL,
+    child_kind INTEGER NOT NULL CHECK (child_kind BETWEEN 1 AND 4),
+    child_id INTEGER NOT NULL,
     
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 """
 
+# The kind -> table name CASE, used by the view and the migration below
+_KIND_TO_TABLE_SQL = "CASE {col} " + " ".join(
+    f"WHEN {kind} THEN '{table}'" for table, kind in LINEAGE_KINDS.items()
+) + " END"
+_TABLE_TO_KIND_SQL = "CASE {col} " + " ".join(
+    f"WHEN '{table}' THEN {kind}" for table, kind in LINEAGE_KINDS.items()
+) + " END"
+
+# [T7v] gov_file_lineage with the table names put back (for reading)
+CREATE_FILE_LINEAGE_VIEW = f"""
+CREATE VIEW IF NOT EXISTS gov_file_lineage_named AS
+SELECT
+    lineage_id,
+    parent_kind,
+    {_KIND_TO_TABLE_SQL.format(col="parent_kind")} AS parent_table,
+    parent_id,
+    child_kind,
+    {_KIND_TO_TABLE_SQL.format(col="child_kind")} AS child_table,
+    child_id,
+    created_at
+FROM gov_file_lineage;
+"""
+
+# One-off upgrade of a gov_file_lineage still in the old TEXT layout
+# (parent_table / parent_id TEXT ...). Runs inside the DDL transaction:
+# the old table is set aside *before* the schema is created...
+MIGRATE_LINEAGE_BEFORE = """
+ALTER TABLE gov_file_lineage RENAME TO gov_file_lineage_old;
+DROP INDEX IF EXISTS idx_lineage_by_parent;
+DROP INDEX IF EXISTS idx_lineage_by_child;
+"""
+
+# ...and its rows are copied across (and it is dropped) after. Links whose
+# ends aren't a file log row with an integer ID can't be represented, and
+# are not carried over.
+MIGRATE_LINEAGE_AFTER = f"""
+INSERT INTO gov_file_lineage (lineage_id, parent_kind, parent_id, child_kind, child_id, created_at)
+SELECT lineage_id,
+       {_TABLE_TO_KIND_SQL.format(col="parent_table")}, CAST(parent_id AS INTEGER),
+       {_TABLE_TO_KIND_SQL.format(col="child_table")}, CAST(child_id AS INTEGER),
+       created_at
+FROM gov_file_lineage_old
+WHERE parent_table IN ({", ".join(f"'{t}'" for t in LINEAGE_KINDS)})
+  AND child_table IN ({", ".join(f"'{t}'" for t in LINEAGE_KINDS)})
+  AND parent_id GLOB '[0-9]*' AND child_id GLOB '[0-9]*';
+DROP TABLE gov_file_lineage_old;
+"""
+
+# One-off upgrade of a plan_dependencies [T11] still keyed by a rowid
+# dependency_id: `CREATE TABLE IF NOT EXISTS` would leave it as it is. It
+# is copied and swapped the same way as the lineage table above: set aside
+# (with its indexes, whose names the new table reuses) before the schema...
+MIGRATE_DEPENDENCIES_BEFORE = """
+ALTER TABLE plan_dependencies RENAME TO plan_dependencies_old;
+DROP INDEX IF EXISTS idx_deps_by_task;
+DROP INDEX IF EXISTS idx_deps_by_predecessor;
+"""
+
+# ...and copied into the WITHOUT ROWID table after. Duplicate links
+# collapse into one under the new primary key.
+MIGRATE_DEPENDENCIES_AFTER = """
+INSERT OR IGNORE INTO plan_dependencies (task_id, predecessor_task_id)
+SELECT task_id, predecessor_task_id
+FROM plan_dependencies_old;
+DROP TABLE plan_dependencies_old;
+"""
+
 # --- [T8] gov_audit_trail (The "Sign-off Sheet") -------------------
 # PURPOSE: The single, central log of all human actions, such as
 #          "sign-off," "validate," "comment," or "approve."
@@ -411,15 +553,15 @@ CREATE TABLE IF NOT EXISTS plan_action_items (
 # --- [T11] plan_dependencies (The "Dependency Links") -------------
 # PURPOSE: This is the "linking table" that creates the dependency web.
 #          It allows a task to have MULTIPLE predecessors.
-# EXAMPLE: (1, 12, 10)  <- "Task 12 depends on Task 10"
-#          (2, 12, 11)  <- "Task 12 also depends on Task 11"
+# EXAMPLE: (12, 10)  <- "Task 12 depends on Task 10"
+#          (12, 11)  <- "Task 12 also depends on Task 11"
 # LINKS:   - Points to [T9] for the task itself.
 #          - Points to [T9] for the task's predecessor.
+#          - The link itself is the primary key, and the table is
+#            WITHOUT ROWID: its one B-tree *is* the (task, predecessor) index.
 # ------------------------------------------------------------------
 CREATE_DEPENDENCIES = """
 CREATE TABLE IF NOT EXISTS plan_dependencies (
-    dependency_id INTEGER PRIMARY KEY AUTOINCREMENT,
-
     -- The "successor" task (e.g., Task C)
     task_id INTEGER NOT NULL, 
 
@@ -427,64 +569,201 @@ CREATE TABLE IF NOT EXISTS plan_dependencies (
     -- This is the task that must be done *before* task_id
     predecessor_task_id INTEGER NOT NULL,
 
+    -- Ensures the same dependency link can't be entered twice
+    PRIMARY KEY (task_id, predecessor_task_id),
+
     -- This ensures that all links are deleted if a task is deleted
     FOREIGN KEY (task_id) 
         REFERENCES plan_project_milestones(milestone_id) 
         ON DELETE CASCADE,
     FOREIGN KEY (predecessor_task_id) 
         REFERENCES plan_project_milestones(milestone_id) 
-        ON DELETE CASCADE,
+        ON DELETE CASCADE
+) WITHOUT ROWID;
+"""
 
-    -- Ensures the same dependency link can't be entered twice
-    UNIQUE(task_id, predecessor_task_id)
+# --- [T12] env_stats (The "Scoreboard") ---------------------------
+# PURPOSE: Running per-environment counts for the Env Manager header
+#          (get_environment_quick_stats), so a page render is one primary
+#          key lookup rather than six COUNT(*) queries.
+# NOTE:    Nothing writes to it directly: the triggers below keep it up to
+#          date, and `initialize_database()` recounts it from scratch
+#          (REFRESH_ENV_STATS) on every run.
+# ------------------------------------------------------------------
+CREATE_ENV_STATS = """
+CREATE TABLE IF NOT EXISTS env_stats (
+    env_id TEXT PRIMARY KEY,
+    file_count INTEGER NOT NULL DEFAULT 0,      -- rows in [T3-T6]
+    plan_total INTEGER NOT NULL DEFAULT 0,      -- rows in [T9]
+    plan_complete INTEGER NOT NULL DEFAULT 0,   -- [T9] rows with status 'Complete'
+    action_open INTEGER NOT NULL DEFAULT 0      -- [T10] rows with status 'Open'
 );
 """
 
+# Per source table: the columns whose updates can move a counter, and what
+# each row adds to its env's counters ({r} is NEW or OLD). `IS`, not `=`:
+# status can be NULL, and the counter must get 0 for it, never NULL.
+ENV_STATS_SOURCES = {
+    **{table: ("env_id", {"file_count": "1"}) for table in LINEAGE_KINDS},
+    "plan_project_milestones": ("env_id, status", {
+        "plan_total": "1",
+        "plan_complete": "({r}.status IS 'Complete')",
+    }),
+    "plan_action_items": ("env_id, status", {"action_open": "({r}.status IS 'Open')"}),
+}
+
+def _env_stats_add(counters: dict, r: str) -> str:
+    """Upserts a row's counters (NEW or OLD) onto its env's env_stats row."""
+    cols = ", ".join(counters)
+    values = ", ".join(expr.format(r=r) for expr in counters.values())
+    sets = ", ".join(f"{c} = {c} + excluded.{c}" for c in counters)
+    return (f"INSERT INTO env_stats (env_id, {cols}) VALUES ({r}.env_id, {values}) "
+            f"ON CONFLICT (env_id) DO UPDATE SET {sets};")
+
+def _env_stats_remove(counters: dict, r: str) -> str:
+    """Takes a row's counters (NEW or OLD) off its env's env_stats row."""
+    sets = ", ".join(f"{c} = {c} - {expr.format(r=r)}" for c, expr in counters.items())
+    return f"UPDATE env_stats SET {sets} WHERE env_id = {r}.env_id;"
+
+def _env_stats_triggers(table: str, watched: str, counters: dict) -> str:
+    """
+    The insert / delete / update triggers that keep env_stats in step with
+    `table`. They are dropped and re-created on every run, so a database
+    always gets the current trigger bodies.
+    """
+    return f"""
+DROP TRIGGER IF EXISTS trg_{table}_stats_ins;
+DROP TRIGGER IF EXISTS trg_{table}_stats_del;
+DROP TRIGGER IF EXISTS trg_{table}_stats_upd;
+CREATE TRIGGER trg_{table}_stats_ins AFTER INSERT ON {table}
+BEGIN {_env_stats_add(counters, "NEW")} END;
+CREATE TRIGGER trg_{table}_stats_del AFTER DELETE ON {table}
+BEGIN {_env_stats_remove(counters, "OLD")} END;
+CREATE TRIGGER trg_{table}_stats_upd AFTER UPDATE OF {watched} ON {table}
+BEGIN {_env_stats_remove(counters, "OLD")} {_env_stats_add(counters, "NEW")} END;
+"""
+
+ENV_STATS_TRIGGERS = "".join(
+    _env_stats_triggers(table, watched, counters)
+    for table, (watched, counters) in ENV_STATS_SOURCES.items()
+)
+
+# Recount every environment from the source tables (heals any drift)
+REFRESH_ENV_STATS = """
+DELETE FROM env_stats;
+INSERT INTO env_stats (env_id, file_count, plan_total, plan_complete, action_open)
+SELECT
+    E.env_id,
+    {file_counts},
+    (SELECT COUNT(*) FROM plan_project_milestones WHERE env_id = E.env_id),
+    (SELECT COUNT(*) FROM plan_project_milestones WHERE env_id = E.env_id AND status = 'Complete'),
+    (SELECT COUNT(*) FROM plan_action_items WHERE env_id = E.env_id AND status = 'Open')
+FROM bp_environments AS E;
+""".format(file_counts=" + ".join(
+    f"(SELECT COUNT(*) FROM {table} WHERE env_id = E.env_id)" for table in LINEAGE_KINDS
+))
+
 # --- [S5] SECTION 5: THE "INDEXES" (PERFORMANCE) ---
 # PURPOSE: These statements don't create new data, but they make
 #          searching for data *much* faster. They are like the
 #          index in the back of a book.
 
-# [I1] Index for all file logs [T3-T6] by environment
+# [I1] Composite index for all file logs [T3-T6] by environment + template,
+#      newest first (the UI's "files of this type in this env" lookups).
+#      Its leftmost column also serves plain `env_id = ?` filters.
+#      (Index names are per table: SQLite index names are database-wide.)
 CREATE_IDX_FILES_BY_ENV = """
-CREATE INDEX IF NOT EXISTS idx_files_by_env
-ON {} (env_id);
+CREATE INDEX IF NOT EXISTS idx_{table}_by_env_template
+ON {table} (env_id, template_id, created_at DESC);
+"""
+
+# [I1b] Index for all file logs [T3-T6] by environment + status
+CREATE_IDX_FILES_BY_ENV_STATUS = """
+CREATE INDEX IF NOT EXISTS idx_{table}_by_env_status
+ON {table} (env_id, current_status);
 """
 
 # [I2] Index for all file logs [T3-T6] by template
 CREATE_IDX_FILES_BY_TEMPLATE = """
-CREATE INDEX IF NOT EXISTS idx_files_by_template
-ON {} (template_id);
+CREATE INDEX IF NOT EXISTS idx_{table}_by_template
+ON {table} (template_id);
+"""
+
+# [I1c] Partial index for all file logs [T3-T6]: only the 'Active' rows.
+#       Much smaller than a full index; used by any query that filters on
+#       the literal `current_status = 'Active'`.
+CREATE_IDX_FILES_ACTIVE = """
+CREATE INDEX IF NOT EXISTS idx_{table}_active_by_env
+ON {table} (env_id, template_id)
+WHERE current_status = 'Active';
+"""
+
+# [I1d] Unique index for all file logs [T3-T6] by content hash, per env.
+#       Makes the "already uploaded to this environment?" check a B-tree
+#       seek, and enforces it. (Per env, not global: cloning copies a file,
+#       hash and all, into the new environment.)
+CREATE_IDX_FILES_BY_HASH = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_{table}_sha256
+ON {table} (file_hash_sha256, env_id);
+"""
+
+# The old single-column [I1] / [I2], superseded by the indexes above.
+# (They shared one name, so only ever existed on the first file table.)
+DROP_OLD_FILE_INDEXES = """
+DROP INDEX IF EXISTS idx_files_by_env;
+DROP INDEX IF EXISTS idx_files_by_template;
 """
 
 # [I3] Index for file lineage [T7] by parent file
 CREATE_IDX_LINEAGE_BY_PARENT = """
 CREATE INDEX IF NOT EXISTS idx_lineage_by_parent
-ON gov_file_lineage (parent_table, parent_id);
+ON gov_file_lineage (parent_kind, parent_id);
 """
 
 # [I4] Index for file lineage [T7] by child file
 CREATE_IDX_LINEAGE_BY_CHILD = """
 CREATE INDEX IF NOT EXISTS idx_lineage_by_child
-ON gov_file_lineage (child_table, child_id);
+ON gov_file_lineage (child_kind, child_id);
 """
 
-# [I5] Index for audit trail [T8] by target (for finding all actions on one item)
+# [I5] Covering index for audit trail [T8] by target, newest first (for
+#      finding the latest actions on one item without a separate sort).
+#      `action` and `signoff_capacity` ride along in the index, so activity
+#      feeds and the "has a SIGN_OFF by a Reviewer?" checks never have to
+#      visit the table itself.
 CREATE_IDX_AUDIT_BY_TARGET = """
-CREATE INDEX IF NOT EXISTS idx_audit_by_target
-ON gov_audit_trail (target_table, target_id);
+CREATE INDEX IF NOT EXISTS idx_audit_target_ts_action
+ON gov_audit_trail (target_table, target_id, timestamp DESC, action, signoff_capacity);
 """
 
-# [I6] Index for audit trail [T8] by user (for finding all actions by one person)
+# [I6] Index for audit trail [T8] by user, newest first (for finding all
+#      actions by one person)
 CREATE_IDX_AUDIT_BY_USER = """
-CREATE INDEX IF NOT EXISTS idx_audit_by_user
-ON gov_audit_trail (user_id);
+CREATE INDEX IF NOT EXISTS idx_audit_by_user_ts
+ON gov_audit_trail (user_id, timestamp DESC);
 """
 
-# [I7] Index for milestones [T9] by environment
+# Earlier versions of [I5] / [I6], superseded by the two indexes above
+DROP_OLD_AUDIT_INDEXES = """
+DROP INDEX IF EXISTS idx_audit_by_target;
+DROP INDEX IF EXISTS idx_audit_by_target_ts;
+DROP INDEX IF EXISTS idx_audit_by_user;
+"""
+
+# [I7] Index for milestones [T9] by environment and status. Still serves
+#      plain env_id lookups, and covers per-status counts (e.g. 'Complete'
+#      in get_environment_quick_stats) without touching the table.
 CREATE_IDX_MILESTONES_BY_ENV = """
-CREATE INDEX IF NOT EXISTS idx_milestones_by_env
-ON plan_project_milestones (env_id);
+DROP INDEX IF EXISTS idx_milestones_by_env;
+CREATE INDEX IF NOT EXISTS idx_milestones_by_env_status
+ON plan_project_milestones (env_id, status);
+"""
+
+# [I7b] Partial index for milestones [T9]: only the 'Pending' ones, by env
+CREATE_IDX_MILESTONES_PENDING = """
+CREATE INDEX IF NOT EXISTS idx_milestones_pending_by_env
+ON plan_project_milestones (env_id)
+WHERE status = 'Pending';
 """
 
 # [I8] Index for action items [T10] by environment
@@ -493,6 +772,13 @@ CREATE INDEX IF NOT EXISTS idx_actions_by_env
 ON plan_action_items (env_id);
 """
 
+# [I8b] Partial index for action items [T10]: only the 'Open' ones, by env
+CREATE_IDX_ACTIONS_OPEN = """
+CREATE INDEX IF NOT EXISTS idx_actions_open_by_env
+ON plan_action_items (env_id)
+WHERE status = 'Open';
+"""
+
 # [I9] Index for action items [T10] by owner
 CREATE_IDX_ACTIONS_BY_OWNER = """
 CREATE INDEX IF NOT EXISTS idx_actions_by_owner
@@ -505,10 +791,11 @@ CREATE INDEX IF NOT EXISTS idx_models_by_run_id
 ON inst_actuarial_model_files (model_run_id);
 """
 
-# [I11] Index for dependencies [T11] by task (Find all predecessors FOR a task)
-CREATE_IDX_DEPS_BY_TASK = """
-CREATE INDEX IF NOT EXISTS idx_deps_by_task
-ON plan_dependencies (task_id);
+# [I11] (Removed) Dependencies [T11] by task are found through the table's
+#       own primary key (task_id, predecessor_task_id), so the old separate
+#       index is dropped.
+DROP_IDX_DEPS_BY_TASK = """
+DROP INDEX IF EXISTS idx_deps_by_task;
 """
 
 # [I12] Index for dependencies [T11] by predecessor (Find all tasks that DEPEND ON a task)
@@ -517,8 +804,115 @@ CREATE INDEX IF NOT EXISTS idx_deps_by_predecessor
 ON plan_dependencies (predecessor_task_id);
 """
 
+# The four file log tables [T3-T6] that get [I1] - [I1d] & [I2]
+FILE_TABLES = tuple(LINEAGE_KINDS)
+
+# [I1] - [I1d] & [I2], formatted for every file table once, at import
+FILE_INDEX_DDL = tuple(
+    template.format(table=table)
+    for template in (
+        CREATE_IDX_FILES_BY_ENV,
+        CREATE_IDX_FILES_BY_ENV_STATUS,
+        CREATE_IDX_FILES_BY_TEMPLATE,
+        CREATE_IDX_FILES_ACTIVE,
+        CREATE_IDX_FILES_BY_HASH,
+    )
+    for table in FILE_TABLES
+)
+
+# Every CREATE statement above, in dependency order, as one SQL script
+SCHEMA_DDL = "".join([
+    # [S1] - [S4] Tables
+    CREATE_ENV_BLUEPRINTS,
+    CREATE_ENV_ROLES,
+    CREATE_ENV_ROLES_TRIGGERS,
+    CREATE_FILE_BLUEPRINTS,
+    CREATE_DATA_FILES,
+    CREATE_MODEL_FILES,
+    CREATE_RESULT_FILES,
+    CREATE_REPORT_FILES,
+    CREATE_FILE_LINEAGE,
+    CREATE_FILE_LINEAGE_VIEW,
+    CREATE_AUDIT_TRAIL,
+    CREATE_PROJECT_MILESTONES,
+    CREATE_ACTION_ITEMS,
+    CREATE_DEPENDENCIES,
+    CREATE_ENV_STATS,
+    ENV_STATS_TRIGGERS,
+
+    # [I1] - [I1d] & [I2] on all four file tables
+    DROP_OLD_FILE_INDEXES,
+    *FILE_INDEX_DDL,
+
+    # [I3] - [I12]
+    CREATE_IDX_LINEAGE_BY_PARENT,
+    CREATE_IDX_LINEAGE_BY_CHILD,
+    DROP_OLD_AUDIT_INDEXES,
+    CREATE_IDX_AUDIT_BY_TARGET,
+    CREATE_IDX_AUDIT_BY_USER,
+    CREATE_IDX_MILESTONES_BY_ENV,
+    CREATE_IDX_MILESTONES_PENDING,
+    CREATE_IDX_ACTIONS_BY_ENV,
+    CREATE_IDX_ACTIONS_OPEN,
+    CREATE_IDX_ACTIONS_BY_OWNER,
+    CREATE_IDX_MODELS_BY_RUN_ID,
+    DROP_IDX_DEPS_BY_TASK,
+    CREATE_IDX_DEPS_BY_PREDECESSOR,
+
+    # [T1b] & [T12] Rebuild last, once every table exists
+    REFRESH_ENV_ROLES,
+    REFRESH_ENV_STATS,
+])
+
+
 # --- [INIT] Main Initializer Function ---
 
+def _has_old_lineage(conn) -> bool:
+    """True if [T7] still has the old TEXT-keyed (parent_table, ...) layout."""
+    return conn.execute(
+        "SELECT 1 FROM pragma_table_info('gov_file_lineage') WHERE name = 'parent_table';"
+    ).fetchone() is not None
+
+def _has_old_dependencies(conn) -> bool:
+    """True if [T11] is still the rowid table keyed by dependency_id."""
+    return conn.execute(
+        "SELECT 1 FROM pragma_table_info('plan_dependencies') WHERE name = 'dependency_id';"
+    ).fetchone() is not None
+
+def apply_schema(conn):
+    """
+    Creates every table, index and trigger that is missing, upgrades any
+    old layouts, and rebuilds the derived tables ([T1b], [T12]). Safe to
+    run on every start: it is all idempotent, in one transaction.
+    Prints nothing, and raises sqlite3.Error (with nothing kept) on failure.
+    registry_service calls this on its first connection, so an existing
+    database is brought up to date without re-running this file by hand.
+    """
+    # WAL lets readers carry on while a writer commits (and the mode is
+    # stored in the file, so every later connection gets it too).
+    conn.execute("PRAGMA journal_mode = WAL;")
+
+    # An existing database may still have the old TEXT-keyed lineage
+    # table [T7] or the rowid dependency table [T11]; if so, they are
+    # converted in the same transaction.
+    before, after = "", ""
+    if _has_old_lineage(conn):
+        before += MIGRATE_LINEAGE_BEFORE
+        after += MIGRATE_LINEAGE_AFTER
+    if _has_old_dependencies(conn):
+        before += MIGRATE_DEPENDENCIES_BEFORE
+        after += MIGRATE_DEPENDENCIES_AFTER
+
+    # All the DDL goes in as one script: one call, one transaction,
+    # one commit at the end (and nothing is kept if any statement fails).
+    try:
+        conn.executescript(f"BEGIN;\n{before}{SCHEMA_DDL}{after}\nCOMMIT;")
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+
 def initialize_database():
     """
     Connects to the SQLite database file and executes all
@@ -531,63 +925,40 @@ def initialize_database():
     try:
         print(f"Connecting to database file: {DB_FILE}...")
         conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
+
+        # synchronous=NORMAL is still crash-safe under WAL (set by
+        # apply_schema), with fewer fsyncs.
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA cache_size = -65536;")     # ~64MB page cache
+        conn.execute("PRAGMA mmap_size = 268435456;")   # 256MB memory-mapped reads
 
         # --- CRITICAL ---
         # Enable Foreign Key support in SQLite (it's OFF by default)
-        c.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA foreign_keys = ON;")
 
         print("Initializing database...")
         print("  - SECTION 1: Blueprints")
-        c.execute(CREATE_ENV_BLUEPRINTS)
-        c.execute(CREATE_FILE_BLUEPRINTS)
-
         print("  - SECTION 2: Instance File Logs")
-        c.execute(CREATE_DATA_FILES)
-        c.execute(CREATE_MODEL_FILES)
-        c.execute(CREATE_RESULT_FILES)
-        c.execute(CREATE_REPORT_FILES)
-
         print("  - SECTION 3: Governance")
-        c.execute(CREATE_FILE_LINEAGE)
-        c.execute(CREATE_AUDIT_TRAIL)
-
         print("  - SECTION 4: Planning")
-        c.execute(CREATE_PROJECT_MILESTONES)
-        c.execute(CREATE_ACTION_ITEMS)
-        c.execute(CREATE_DEPENDENCIES)
-        
-        print(f"... 11 tables created (if they didn't exist).")
-
         print("  - SECTION 5: Indexes (for performance)")
-        
-        # [I1] & [I2] on all four file tables
-        file_tables = [
-            'inst_data_input_files', 
-            'inst_actuarial_model_files', 
-            'inst_result_files', 
-            'inst_report_files'
-        ]
-        for table in file_tables:
-            c.execute(CREATE_IDX_FILES_BY_ENV.format(table))
-            c.execute(CREATE_IDX_FILES_BY_TEMPLATE.format(table))
-        
-        # [I3] - [I10]
-        c.execute(CREATE_IDX_LINEAGE_BY_PARENT)
-        c.execute(CREATE_IDX_LINEAGE_BY_CHILD)
-        c.execute(CREATE_IDX_AUDIT_BY_TARGET)
-        c.execute(CREATE_IDX_AUDIT_BY_USER)
-        c.execute(CREATE_IDX_MILESTONES_BY_ENV)
-        c.execute(CREATE_IDX_ACTIONS_BY_ENV)
-        c.execute(CREATE_IDX_ACTIONS_BY_OWNER)
-        c.execute(CREATE_IDX_MODELS_BY_RUN_ID)
-        c.execute(CREATE_IDX_DEPS_BY_TASK)
-        c.execute(CREATE_IDX_DEPS_BY_PREDECESSOR)
-
-        print(f"... 12 indexes created (if they didn't exist).")
-
-        # Commit all changes at once
-        conn.commit()
+
+        if _has_old_lineage(conn):
+            print("  - Upgrading gov_file_lineage to integer kinds")
+        if _has_old_dependencies(conn):
+            print("  - Upgrading plan_dependencies to a WITHOUT ROWID table")
+        apply_schema(conn)
+
+        table_count = SCHEMA_DDL.count("CREATE TABLE IF NOT EXISTS")
+        print(f"... {table_count} tables and their indexes created (if they didn't exist).")
+
+        # Give the query planner statistics (sqlite_stat1) for all the
+        # indexes above, so it can pick between them on multi-column filters.
+        # `PRAGMA optimize` then keeps them fresh on later runs.
+        conn.execute("ANALYZE;")
+        conn.execute("PRAGMA optimize;")
+        print("... planner statistics gathered (ANALYZE).")
 
         print("\n-------------------------------------------------")
         print(f"SUCCESS: Database '{DB_FILE}' is initialized and ready.")
@@ -51,7 +51,7 @@ This file is organized into 9 logical sections.
 (Internal tools used by the public functions. Not for external use.)
 
     [H-DB] Database Connection
-    - _get_db_conn(): Returns a new, configured connection to the SQLite DB.
+    - _get_db_conn(): Returns a configured connection to the SQLite DB (reads are pooled).
 
     [H-LOG] Audit Logging
     - _log_audit(): (Internal) Writes a new row to the gov_audit_trail table.
@@ -179,11 +179,17 @@ import pandas as pd
 import io  # Used for in-memory file simulation
 import requests
 import difflib
+import queue
+import threading
+from registry_schema import DB_FILE, apply_schema, open_ro, open_rw
+from registry_schema import LINEAGE_KINDS  # file log table -> lineage "kind" (Table 7)
 
 # --- [S1] SECTION 1: CONFIGURATION & CONSTANTS ---
 
-# Database file
-DB_FILE = "atlas_registry.db"
+# Database file: DB_FILE comes from registry_schema (ATLAS_REGISTRY_DB env var)
+
+# How many idle read-only connections to keep open for reuse (see [H-DB])
+READ_POOL_SIZE = 8
 
 # Root path for all physical environment folders
 # Use an absolute path for your server
@@ -257,13 +263,108 @@ TABLE_ID_MAP = {
     "plan_action_items":          "action_id"
 }
 
+# The four file instance tables [T3-T6] and their ID columns, picked out of
+# TABLE_ID_MAP once here rather than filtered on every call
+_INST_TABLES = tuple(
+    (table, id_col) for table, id_col in TABLE_ID_MAP.items() if table.startswith("inst_")
+)
+
 # --- [S2] SECTION 2: PRIVATE HELPER FUNCTIONS ---
 
 # --- [H-DB] Database Connection ---
-def _get_db_conn():
-    """[PRIVATE] Returns a new, configured connection to the SQLite database."""
+class _PooledConnection(sqlite3.Connection):
+    """
+    [PRIVATE] A read-only connection that goes back to `_READ_POOL` when
+    closed, so callers keep the usual `finally: conn.close()` pattern.
+    """
+    def close(self):
+        _READ_POOL.release(self)
+
+class _ConnPool:
+    """
+    [PRIVATE] A small LIFO pool of idle, already-configured read-only
+    connections. Reusing them keeps SQLite's page cache warm between calls
+    and skips the open + PRAGMA setup. Writers are not pooled: SQLite only
+    allows one at a time anyway, and under WAL readers never block it.
+    """
+    def __init__(self, maxsize: int):
+        self._idle = queue.LifoQueue(maxsize=maxsize)
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def release(self, conn):
+        # Never hand on a connection still holding a read snapshot
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            sqlite3.Connection.close(conn)
+
+_READ_POOL = _ConnPool(READ_POOL_SIZE)
+
+# Set once registry_schema.apply_schema() has run against DB_FILE
+_SCHEMA_READY = threading.Event()
+_SCHEMA_LOCK = threading.Lock()
+
+def _ensure_schema():
+    """
+    [PRIVATE] Brings the database up to the current schema (new tables,
+    indexes, triggers, and any layout upgrades) once per process, before
+    the first connection is handed out. Raises sqlite3.Error on failure.
+    """
+    if _SCHEMA_READY.is_set():
+        return
+    with _SCHEMA_LOCK:
+        if _SCHEMA_READY.is_set():
+            return
+        conn = open_rw(timeout=5.0)
+        try:
+            conn.execute("PRAGMA foreign_keys = ON;")
+            apply_schema(conn)
+        finally:
+            conn.close()
+        _SCHEMA_READY.set()
+
+def _get_db_conn(read_only: bool = False):
+    """
+    [PRIVATE] Returns a configured connection to the SQLite database.
+    Pure lookups pass `read_only=True` for a read-only connection, which
+    never contends for the write lock. These come from `_READ_POOL`, and
+    `conn.close()` returns them to it.
+    Any connection kept open for a long time (rather than per call) should
+    run `PRAGMA optimize;` before it is closed, to keep the planner's
+    statistics (from registry_schema's ANALYZE) up to date.
+    """
+    if read_only:
+        conn = _READ_POOL.acquire()
+        if conn:
+            return conn
     try:
-        conn = sqlite3.connect(DB_FILE)
+        _ensure_schema()
+        # `timeout` is SQLite's busy_timeout: wait up to 5s for a lock
+        # instead of failing straight away with "database is locked".
+        # `cached_statements` is the per-connection cache of prepared SQL,
+        # matched by SQL text: big enough that the per-table queries
+        # (one text per table, e.g. the clone INSERTs) aren't re-parsed.
+        if read_only:
+            # Pooled connections may be picked up by another session's
+            # thread, but only one thread uses each one at a time.
+            conn = open_ro(timeout=5.0, cached_statements=256,
+                           factory=_PooledConnection, check_same_thread=False)
+        else:
+            conn = open_rw(timeout=5.0, cached_statements=256)
+        # WAL is a property of the file (set once by registry_schema), but
+        # these are per-connection: one fsync per commit, not two.
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA cache_size = -20000;")     # ~20MB page cache
+        # Read pages straight from the OS page cache (no read() + copy)
+        conn.execute("PRAGMA mmap_size = 268435456;")   # 256MB
         # Enable Foreign Key support (off by default)
         conn.execute("PRAGMA foreign_keys = ON;")
         # Return rows as dictionary-like objects
@@ -274,6 +375,11 @@ def _get_db_conn():
         return None
 
 # --- [H-LOG] Audit Logging ---
+_AUDIT_INSERT_SQL = """
+    INSERT INTO gov_audit_trail (user_id, action, target_table, target_id, signoff_capacity, comment)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 def _log_audit(conn, user_id: str, action: str, target_table: str, target_id,
                comment: str, capacity: str = "System"):
     """
@@ -282,10 +388,7 @@ def _log_audit(conn, user_id: str, action: str, target_table: str, target_id,
     (it requires an active `conn` object).
     """
     conn.execute(
-        """
-        INSERT INTO gov_audit_trail (user_id, action, target_table, target_id, signoff_capacity, comment)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
+        _AUDIT_INSERT_SQL,
         (user_id, action, target_table, str(target_id), capacity, comment) # target_id MUST be TEXT
     )
 
@@ -295,11 +398,22 @@ def _hash_file_from_memory(uploaded_file):
     [PRIVATE] Calculates the SHA-256 hash of a file-like object from memory.
     Reads in chunks to handle large files safely.
     """
-    sha256_hash = hashlib.sha256()
+    if hasattr(uploaded_file, "getbuffer"):
+        # In-memory upload (Streamlit's UploadedFile, io.BytesIO): hash the
+        # whole buffer in one C call, without moving the file pointer
+        with uploaded_file.getbuffer() as buf:
+            return hashlib.sha256(buf).hexdigest()
+
     uploaded_file.seek(0) # Reset file pointer
-    # Read and update hash in chunks of 4K
-    for byte_block in iter(lambda: uploaded_file.read(4096), b""):
-        sha256_hash.update(byte_block)
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: the read loop runs in C, instead of one Python
+        # call per chunk
+        sha256_hash = hashlib.file_digest(uploaded_file, "sha256")
+    else:
+        sha256_hash = hashlib.sha256()
+        # Read and update hash in chunks of 256K
+        for byte_block in iter(lambda: uploaded_file.read(262144), b""):
+            sha256_hash.update(byte_block)
     uploaded_file.seek(0) # Reset again for the actual save
     return sha256_hash.hexdigest()
 
@@ -317,32 +431,37 @@ def _save_uploaded_file(uploaded_file, file_path: str) -> dict:
     if os.path.exists(full_path):
         raise ValueError(f"File already exists at this path: {full_path}")
 
-    # Write the file
-    with open(full_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    # Write the file. The size comes from the buffer we just wrote,
+    # so there's no need to stat the file afterwards.
+    with open(full_path, "wb") as f, uploaded_file.getbuffer() as buf:
+        f.write(buf)
+        file_size_bytes = buf.nbytes
 
     # Get metrics
-    file_size_bytes = os.path.getsize(full_path)
     file_size_kb = round(file_size_bytes / 1024, 2)
 
+    # The structure is read from the upload still in memory, not re-read
+    # from disk. It has to be done here (not deferred): the upload's
+    # schema validation runs against it before the row is written.
     actual_structure = {}
     try:
+        uploaded_file.seek(0)
         if uploaded_file.name.endswith((".xlsx", ".xlsb", ".xlsm", ".xls")):
             # Use pandas to get all sheet names
-            xls = pd.ExcelFile(full_path)
+            xls = pd.ExcelFile(uploaded_file)
             actual_structure = {"tabs": xls.sheet_names}
 
         elif uploaded_file.name.endswith(".csv"):
             # Use pandas to get all column headers
             # nrows=0 loads no data, just the headers
-            df = pd.read_csv(full_path, nrows=0)
+            df = pd.read_csv(uploaded_file, nrows=0)
             actual_structure = {"columns": df.columns.tolist()}
 
         elif uploaded_file.name.endswith(".txt"):
             # Try to read as a CSV (tab or space delimited)
             # We "sniff" the delimiter
             try:
-                df = pd.read_csv(full_path, sep=r'\s+', nrows=0, engine='python')
+                df = pd.read_csv(uploaded_file, sep=r'\s+', nrows=0, engine='python')
                 if len(df.columns) > 1:
                     actual_structure = {"columns": df.columns.tolist()}
                 else:
@@ -356,7 +475,9 @@ def _save_uploaded_file(uploaded_file, file_path: str) -> dict:
         # If the file is corrupt and pandas can't read it, log the error
         print(f"CRITICAL: Failed to extract schema from {full_path}: {e}", file=sys.stderr)
         actual_structure = {"error": f"File is corrupt or unreadable: {e}"}
-    
+    finally:
+        uploaded_file.seek(0)
+
     # Return metrics as a dict
     return {
         "file_size_kb": file_size_kb,
@@ -376,6 +497,19 @@ def _create_physical_folders(env_name: str) -> str:
         os.makedirs(os.path.join(base_path, folder), exist_ok=True)
     return base_path
 
+def _link_or_copy(src: str, dst: str):
+    """
+    [PRIVATE] `copy_function` for cloning: hard-links the file instead of
+    copying its bytes. This is safe because stored files are never changed
+    in place (an edit or upload always writes a new file at a new path).
+    Falls back to a real copy where links aren't possible (e.g. EXDEV when
+    the env root spans filesystems).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 def _clone_physical_folders(source_env_name: str, new_env_name: str, folders_to_clone: list):
     """
     [PRIVATE] Selectively copies physical folders and files from a source env.
@@ -398,7 +532,7 @@ def _clone_physical_folders(source_env_name: str, new_env_name: str, folders_to_
         if folder in folders_to_clone:
             source_folder_path = os.path.join(source_path, folder)
             if os.path.exists(source_folder_path):
-                shutil.copytree(source_folder_path, new_folder_path)
+                shutil.copytree(source_folder_path, new_folder_path, copy_function=_link_or_copy)
             else:
                 os.makedirs(new_folder_path, exist_ok=True) # Create empty if source missing
         else:
@@ -419,28 +553,26 @@ def _get_files_to_clone(conn, source_env_id: str, versioning_logic: str) -> dict
     }
     
     # Iterate robustly using our map
-    for table, id_col in TABLE_ID_MAP.items():
-        if not table.startswith("inst_"):
-            continue # Only care about file tables
-
+    for table, id_col in _INST_TABLES:
         base_query = f"SELECT {id_col} FROM {table} WHERE env_id = ?"
 
         if versioning_logic == "Latest Approved":
             # "Clean Snapshot" logic.
             # Finds files that are 'Active' AND have a 'SIGN_OFF'.
+            # One join (a seek into idx_audit_target_ts_action per file),
+            # with DISTINCT since a file can be signed off more than once.
+            # target_id is TEXT: CAST the INT ID so the index can be used.
             query = f"""
-                SELECT T1.{id_col}
+                SELECT DISTINCT T1.{id_col}
                 FROM {table} AS T1
+                JOIN gov_audit_trail AS T2
+                  ON T2.target_table = ?
+                 AND T2.target_id = CAST(T1.{id_col} AS TEXT)
+                 AND T2.action = 'SIGN_OFF'
+                 AND T2.signoff_capacity IN ('Reviewer', 'Business Owner')
                 WHERE T1.env_id = ? AND T1.current_status = 'Active'
-                AND EXISTS (
-                    SELECT 1 FROM gov_audit_trail AS T2
-                    WHERE T2.target_table = ?
-                      AND T2.target_id = T1.{id_col}
-                      AND T2.action = 'SIGN_OFF'
-                      AND T2.signoff_capacity IN ('Reviewer', 'Business Owner')
-                )
             """
-            files_to_clone_ids[table] = [row[0] for row in conn.execute(query, (source_env_id, table)).fetchall()]
+            files_to_clone_ids[table] = [row[0] for row in conn.execute(query, (table, source_env_id)).fetchall()]
 
         elif versioning_logic == "Full History (No Superseded)":
             # Gets all 'Active' and 'Rejected' files.
@@ -484,83 +616,108 @@ def _clone_db_records(conn, source_env: dict, new_env_id: str, new_env_name: str
         if not file_ids_in_this_folder:
             continue
 
-        placeholders = ', '.join(['?'] * len(file_ids_in_this_folder))
-        files = conn.execute(f"SELECT * FROM {table} WHERE {id_col} IN ({placeholders})", file_ids_in_this_folder).fetchall()
-
-        for file in files:
-            file_dict = dict(file)
-            original_file_id_int = file_dict.pop(id_col) # Get the original INT ID
-
-            file_dict['env_id'] = new_env_id
-            file_dict['created_by'] = user_id
-            file_dict['created_at'] = now
-            # New clones are always set to 'Active' regardless of original status
-            file_dict['current_status'] = 'Active' 
+        # The IDs go in as one JSON array, so the SQL text is the same for
+        # every clone and there is no limit on how many can be passed
+        files = conn.execute(
+            f"SELECT * FROM {table} WHERE {id_col} IN (SELECT value FROM json_each(?))",
+            (json.dumps(file_ids_in_this_folder),)
+        ).fetchall()
+        if not files:
+            continue
 
-            # Re-create the file path
-            original_path = file_dict['file_path']
-            # This replaces the *folder name* part of the path
-            file_dict['file_path'] = original_path.replace(source_env_name, new_env_name, 1)
+        # Every row comes from the same `SELECT *`, so the column order is fixed
+        cols = files[0].keys()
+        id_idx, path_idx = cols.index(id_col), cols.index('file_path')
 
-            cols = ', '.join(file_dict.keys())
-            q_marks = ', '.join(['?'] * len(file_dict))
-            values = list(file_dict.values())
+        # Pre-allocate the new INT IDs so the whole folder goes in with one
+        # executemany. The caller holds the write lock (BEGIN IMMEDIATE),
+        # and with AUTOINCREMENT, sqlite_sequence is >= every ID ever used.
+        seq_row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)).fetchone()
+        next_id = (seq_row[0] if seq_row else 0) + 1
 
-            cursor = conn.execute(f"INSERT INTO {table} ({cols}) VALUES ({q_marks})", values)
-            new_file_id_int = cursor.lastrowid # Get the new INT ID
+        overrides = {
+            cols.index('env_id'): new_env_id,
+            cols.index('created_by'): user_id,
+            cols.index('created_at'): now,
+            # New clones are always set to 'Active' regardless of original status
+            cols.index('current_status'): 'Active',
+        }
+        file_rows, audit_rows = [], []
+        for new_file_id_int, file in enumerate(files, start=next_id):
+            values = list(file)
+            original_file_id_int = file[id_col] # Get the original INT ID
+            values[id_idx] = new_file_id_int
+            for idx, value in overrides.items():
+                values[idx] = value
+            # Re-create the file path: this replaces the *folder name* part of the path
+            values[path_idx] = values[path_idx].replace(source_env_name, new_env_name, 1)
+            file_rows.append(values)
 
             id_map_int_to_int[table][original_file_id_int] = new_file_id_int
+            audit_rows.append((
+                user_id, "CLONE_FILE", table, str(new_file_id_int), "System", # Log with new INT ID
+                f"Cloned from {table}:{original_file_id_int} (env {source_env_id})"
+            ))
 
-            _log_audit(
-                conn, user_id, "CLONE_FILE", table, new_file_id_int, # Log with new INT ID
-                f"Cloned from {table}:{original_file_id_int} (env {source_env_id})", "System"
-            )
+        conn.executemany(
+            f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join(['?'] * len(cols))})",
+            file_rows
+        )
+        conn.executemany(_AUDIT_INSERT_SQL, audit_rows)
 
     # 4. Clone the Lineage (Table 7) for the files we just copied
-    # Create flat maps of { old_int_id: new_int_id }
-    all_new_parent_ids_map = {**id_map_int_to_int["inst_data_input_files"], **id_map_int_to_int["inst_actuarial_model_files"], **id_map_int_to_int["inst_result_files"], **id_map_int_to_int["inst_report_files"]}
-    all_new_child_ids_map = {**id_map_int_to_int["inst_actuarial_model_files"], **id_map_int_to_int["inst_result_files"], **id_map_int_to_int["inst_report_files"]}
-
-    if all_new_parent_ids_map and all_new_child_ids_map:
-        # Create string lists of all *original* parent/child IDs (as TEXT)
-        parent_id_list_str = ", ".join([f"'{k}'" for k in all_new_parent_ids_map.keys()])
-        child_id_list_str = ", ".join([f"'{k}'" for k in all_new_child_ids_map.keys()])
-
-        lineage_rows = conn.execute(
-            f"""
-            SELECT * FROM gov_file_lineage
-            WHERE parent_id IN ({parent_id_list_str})
-            AND child_id IN ({child_id_list_str})
-            """
-        ).fetchall()
-
-        for link in lineage_rows:
-            # link['parent_id'] and link['child_id'] are TEXT. Must cast to INT for map lookup.
-            old_parent_id_int = int(link['parent_id'])
-            old_child_id_int = int(link['child_id'])
-
-            # Find the *new* INT ID that corresponds to the *old* INT ID
-            new_parent_id_int = all_new_parent_ids_map.get(old_parent_id_int)
-            new_child_id_int = all_new_child_ids_map.get(old_child_id_int)
+    # Load the old -> new ID map into a temp table, keyed by lineage kind
+    # (IDs are only unique per table). The queries below then join against
+    # it: fixed SQL texts, with no IN list that grows with the clone.
+    conn.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS clone_id_map (
+            kind INTEGER NOT NULL,
+            tbl TEXT NOT NULL,
+            old_id INTEGER NOT NULL,
+            new_id INTEGER NOT NULL,
+            PRIMARY KEY (kind, old_id)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("DELETE FROM temp.clone_id_map")
+    conn.executemany(
+        "INSERT INTO temp.clone_id_map (kind, tbl, old_id, new_id) VALUES (?, ?, ?, ?)",
+        [(LINEAGE_KINDS[table], table, old_id, new_id)
+         for table, id_map in id_map_int_to_int.items()
+         for old_id, new_id in id_map.items()]
+    )
 
-            if new_parent_id_int and new_child_id_int: # Only create a link if both ends were copied
-                conn.execute(
-                    "INSERT INTO gov_file_lineage (parent_table, parent_id, child_table, child_id) VALUES (?, ?, ?, ?)",
-                    (link['parent_table'], str(new_parent_id_int), link['child_table'], str(new_child_id_int)) # Insert as TEXT
-                )
+    # Copy every link where both ends were copied, remapping both IDs in
+    # the same statement (the join does the old -> new lookup)
+    conn.execute(
+        """
+        INSERT INTO gov_file_lineage (parent_kind, parent_id, child_kind, child_id)
+        SELECT L.parent_kind, P.new_id, L.child_kind, C.new_id
+        FROM gov_file_lineage AS L
+        JOIN temp.clone_id_map AS P ON P.kind = L.parent_kind AND P.old_id = L.parent_id
+        JOIN temp.clone_id_map AS C ON C.kind = L.child_kind AND C.old_id = L.child_id
+        """
+    )
 
     # 5. Clone the Audit Trail (Table 8) *only* if doing a Forensic Copy
     if versioning_logic == "Carbon Copy (Forensic)":
-        all_new_file_ids_map = {**all_new_parent_ids_map, **all_new_child_ids_map}
-        if not all_new_file_ids_map:
-            return
-
-        # We must use str() for `target_id` as it's a TEXT column
-        old_id_list_str = ", ".join([f"'{k}'" for k in all_new_file_ids_map.keys()])
+        # `target_id` is a TEXT column, so match it against the ID as TEXT
         audit_rows = conn.execute(
-            f"SELECT * FROM gov_audit_trail WHERE target_table LIKE 'inst_%' AND target_id IN ({old_id_list_str})"
+            """
+            SELECT A.* FROM gov_audit_trail AS A
+            JOIN temp.clone_id_map AS M
+              ON A.target_table = M.tbl
+             AND A.target_id = CAST(M.old_id AS TEXT)
+            """
         ).fetchall()
 
+        if not audit_rows:
+            return
+
+        # Same `SELECT *` for every row: fix the column order once, minus the old key
+        cols = [c for c in audit_rows[0].keys() if c != 'audit_log_id']
+        new_audit_rows = []
         for row in audit_rows:
             row_dict = dict(row)
             target_table = row_dict['target_table']
@@ -570,15 +727,13 @@ def _clone_db_records(conn, source_env: dict, new_env_id: str, new_env_name: str
             if target_table in id_map_int_to_int and int(old_target_id_text) in id_map_int_to_int[target_table]:
                 # Look up by INT
                 new_target_id_int = id_map_int_to_int[target_table][int(old_target_id_text)]
-
-                row_dict.pop('audit_log_id') # Remove old key
                 row_dict['target_id'] = str(new_target_id_int) # Set new key as TEXT
+                new_audit_rows.append([row_dict[c] for c in cols])
 
-                cols = ', '.join(row_dict.keys())
-                placeholders = ', '.join(['?'] * len(row_dict))
-                values = list(row_dict.values())
-
-                conn.execute(f"INSERT INTO gov_audit_trail ({cols}) VALUES ({placeholders})", values)
+        conn.executemany(
+            f"INSERT INTO gov_audit_trail ({', '.join(cols)}) VALUES ({', '.join(['?'] * len(cols))})",
+            new_audit_rows
+        )
 
 def _clone_project_plan(conn, source_env_id: str, new_env_id: str, user_id: str):
     """
@@ -602,47 +757,43 @@ def _clone_project_plan(conn, source_env_id: str, new_env_id: str, user_id: str)
                    "Source plan was empty, nothing to clone.", "System")
         return  # Nothing to do
 
-    # 3. Loop and create new milestones
-    for task_row in milestones:
+    # 3. Create the new milestones, copying the title, duration, due_date
+    #    (if any), owner, status, and target links. (Any old cached
+    #    calc_start_date / calc_due_date is not copied.)
+    cols_to_insert = [
+        'milestone_id', 'env_id', 'title', 'duration_days', 'due_date',
+        'owner_user_id', 'status', 'created_at', 'created_by',
+        'target_table', 'target_id'
+    ]
+
+    # Pre-allocate the new IDs (as in _clone_db_records) so the whole plan
+    # goes in with one executemany and the old -> new map is known up front.
+    seq_row = conn.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = 'plan_project_milestones'"
+    ).fetchone()
+    next_id = (seq_row[0] if seq_row else 0) + 1
+
+    now = datetime.now()
+    rows_to_insert = []
+    for new_milestone_id, task_row in enumerate(milestones, start=next_id):
         task = dict(task_row)
-        old_milestone_id = task.pop('milestone_id')
 
-        # Set new env_id and creator
+        # Store the mapping
+        id_map[task['milestone_id']] = new_milestone_id
+
+        # Set new ID, env_id and creator
+        task['milestone_id'] = new_milestone_id
         task['env_id'] = new_env_id
         task['created_by'] = user_id
-        task['created_at'] = datetime.now()
-
-        # The schema is now simpler:
-        # We just copy the title, duration, due_date (if any),
-        # owner, status, and target links.
-
-        # Pop keys that we don't want to copy directly
-        task.pop('calc_start_date', None)  # Remove any old cached data
-        task.pop('calc_due_date', None)
-
-        # Prepare columns for safe insert
-        # (This is more robust than the previous version)
-        cols_to_insert = [
-            'env_id', 'title', 'duration_days', 'due_date',
-            'owner_user_id', 'status', 'created_at', 'created_by',
-            'target_table', 'target_id'
-        ]
-
-        # Build the final data tuple for insertion
-        data_to_insert = []
-        for col in cols_to_insert:
-            data_to_insert.append(task.get(col))
+        task['created_at'] = now
 
-        q_marks = ', '.join(['?'] * len(cols_to_insert))
+        rows_to_insert.append([task.get(col) for col in cols_to_insert])
 
-        cursor = conn.execute(
-            f"INSERT INTO plan_project_milestones ({', '.join(cols_to_insert)}) VALUES ({q_marks})",
-            data_to_insert
-        )
-        new_milestone_id = cursor.lastrowid
-
-        # Store the mapping
-        id_map[old_milestone_id] = new_milestone_id
+    conn.executemany(
+        f"INSERT INTO plan_project_milestones ({', '.join(cols_to_insert)}) "
+        f"VALUES ({', '.join(['?'] * len(cols_to_insert))})",
+        rows_to_insert
+    )
 
     # 4. Get all dependency links [T11] from the source plan
     #    (We must join to [T9] to ensure we only get links
@@ -691,15 +842,17 @@ def get_visible_environments(user_role: str):
     Gets all 'Active' or 'Locked' environments from Table 1
     that the given user role is allowed to see.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
-        # 'instr' is a safe way to check for a substring in a comma-delimited list
+        # Role membership comes from bp_environment_roles [T1b] (an index
+        # seek on role), not a substring scan of every allowed_roles string.
+        # An 'all' environment has an 'all' row there too.
         return [dict(row) for row in conn.execute(
             """
             SELECT * FROM bp_environments
             WHERE current_status IN ('Active', 'Locked')
-            AND (allowed_roles = 'all' OR instr(',' || allowed_roles || ',', ',' || ? || ',') > 0)
+            AND env_id IN (SELECT env_id FROM bp_environment_roles WHERE role IN (?, 'all'))
             ORDER BY env_cat, env_name DESC
             """,
             (user_role,)
@@ -709,7 +862,7 @@ def get_visible_environments(user_role: str):
 
 def get_all_environments():
     """(For Admin Dashboard) Fetches ALL environments from Table 1, including Archived."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try: 
         return [dict(row) for row in conn.execute("SELECT * FROM bp_environments ORDER BY created_at DESC").fetchall()]
@@ -718,7 +871,7 @@ def get_all_environments():
 
 def get_environment_by_id(env_id: str):
     """(For Admin Forms) Fetches a single environment by its ID (Table 1)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return None
     try:
         row = conn.execute("SELECT * FROM bp_environments WHERE env_id = ?", (env_id,)).fetchone()
@@ -731,47 +884,31 @@ def get_environment_quick_stats(env_id: str) -> dict:
     (For Env Manager UI) Gets high-level file and task counts
     for a single environment.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return {}
 
-    stats = {
-        "file_count_total": 0,
-        "plan_task_total": 0,
-        "plan_task_complete": 0,
-        "action_item_open": 0
-    }
-
     try:
-        # 1. File Counts
-        file_tables = [
-            "inst_data_input_files", "inst_actuarial_model_files",
-            "inst_result_files", "inst_report_files"
-        ]
-        file_count = 0
-        for table in file_tables:
-            count = conn.execute(f"SELECT COUNT(*) FROM {table} WHERE env_id = ?", (env_id,)).fetchone()[0]
-            file_count += count
-        stats['file_count_total'] = file_count
-
-        # 2. Plan Counts
-        plan_rows = conn.execute(
-            "SELECT status, COUNT(*) FROM plan_project_milestones WHERE env_id = ? GROUP BY status",
-            (env_id,)
-        ).fetchall()
-
-        for row in plan_rows:
-            stats['plan_task_total'] += row[1]
-            if row[0] == 'Complete':
-                stats['plan_task_complete'] = row[1]
-
-        # 3. Action Item Counts
-        action_count = conn.execute(
-            "SELECT COUNT(*) FROM plan_action_items WHERE env_id = ? AND status = 'Open'",
+        # The counts are kept up to date by triggers in env_stats [T12],
+        # so this is a single primary key lookup.
+        row = conn.execute(
+            """
+            SELECT file_count AS file_count_total,
+                   plan_total AS plan_task_total,
+                   plan_complete AS plan_task_complete,
+                   action_open AS action_item_open
+            FROM env_stats WHERE env_id = ?
+            """,
             (env_id,)
-        ).fetchone()[0]
-        stats['action_item_open'] = action_count
-
-        return stats
+        ).fetchone()
+        if not row:
+            # Nothing has been added to this environment yet
+            return {
+                "file_count_total": 0,
+                "plan_task_total": 0,
+                "plan_task_complete": 0,
+                "action_item_open": 0
+            }
+        return dict(row)
 
     finally:
         conn.close()
@@ -780,7 +917,7 @@ def get_environment_quick_stats(env_id: str) -> dict:
 
 def get_all_file_blueprints(stage: str = None):
     """(For Blueprint Manager) Fetches all file blueprints (Table 2), optionally filtered by stage."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         query = "SELECT * FROM bp_file_templates"
@@ -795,7 +932,7 @@ def get_all_file_blueprints(stage: str = None):
 
 def get_file_blueprint_by_id(template_id: str):
     """(For Blueprint Forms) Fetches a single file blueprint by its ID (Table 2)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return None
     try:
         row = conn.execute("SELECT * FROM bp_file_templates WHERE template_id = ?", (template_id,)).fetchone()
@@ -807,7 +944,7 @@ def get_file_blueprint_by_id(template_id: str):
 
 def get_all_files_in_environment(env_id: str, stage: str = None):
     """(For Admin Deep-Dive) Fetches a summary of ALL files (Tables 3-6) in a given env."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         tables_to_query = []
@@ -817,7 +954,7 @@ def get_all_files_in_environment(env_id: str, stage: str = None):
                 tables_to_query.append(table_name)
         else:
             # Get all file instance tables
-            tables_to_query = [table for table in TABLE_ID_MAP.keys() if table.startswith("inst_")]
+            tables_to_query = [table for table, _ in _INST_TABLES]
 
         union_parts = []
         params = []
@@ -856,7 +993,7 @@ def get_files_for_user_dashboard(env_id: str, stage: str, user_id: str, user_rol
 
     This avoids the "N+1" query problem and is very fast.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return {"pending_doer": [], "pending_reviewer": [], "all_files": []}
     
     empty_return = {"pending_doer": [], "pending_reviewer": [], "all_files": []}
@@ -962,7 +1099,7 @@ def get_all_versions_for_template(env_id: str, template_id: str):
     (For UI "Data Explorer") Gets all versions of a single file
     in one environment.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         # 1. We must find the blueprint to get the stage and table name
@@ -1067,7 +1204,7 @@ def get_file_comparison(table_name: str, new_file_id: int, old_file_id: int):
     1. Keyed Diff (Smart): Finds true adds, deletes, and mods.
     2. Basic Diff (Simple): Compares row-by-row.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn:
         return {"type": "error", "data": "Database connection failed."}
 
@@ -1227,7 +1364,7 @@ def get_approved_files_for_blueprint(env_id: str, template_id: str):
     2. It has a 'Doer' sign-off.
     3. If required, it *also* has a 'Reviewer' sign-off.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
 
     try:
@@ -1304,7 +1441,7 @@ def get_file_by_id(table_name: str, file_id: int):
     (For Internal Use) Gets a single file record by its
     table name and primary key.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return None
     try:
         id_col = TABLE_ID_MAP.get(table_name)
@@ -1329,7 +1466,7 @@ def get_all_files_for_template(env_id: str, template_id: str, user_id: str = Non
     - If 'user_id' is provided, it filters by 'created_by' (for "My Drafts").
     - If 'user_id' is None, it gets *all* versions (for "Explorer").
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         # 1. Find the blueprint to get the table name
@@ -1370,7 +1507,7 @@ def get_all_files_for_template(env_id: str, template_id: str, user_id: str = Non
 
 def get_audit_log_for_target(target_table: str, target_id: str):
     """(For Admin Deep-Dive) Fetches the full human sign-off history for a *specific file* or *blueprint* (Table 8)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         return [dict(row) for row in conn.execute(
@@ -1385,7 +1522,7 @@ def get_audit_log_for_target_list(target_table: str, target_ids: list):
     (For Manager Dashboards) Fetches the full human sign-off history
     for a *list* of specific file IDs in one efficient query.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     if not target_ids:
         return []  # Return empty if no IDs are provided
@@ -1409,7 +1546,7 @@ def get_audit_log_for_target_list(target_table: str, target_ids: list):
 
 def get_environment_audit_log_all(limit: int = 100):
     """(For Admin Dashboard) Fetches the last N human actions on *any* environment (Table 8)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         return [dict(row) for row in conn.execute(
@@ -1421,7 +1558,7 @@ def get_environment_audit_log_all(limit: int = 100):
 
 def get_audit_log_all_actions(limit: int = 50):
     """(For System Status UI) Gets the last N *all* human actions from Table 8."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         return [dict(row) for row in conn.execute(
@@ -1433,24 +1570,24 @@ def get_audit_log_all_actions(limit: int = 50):
 
 def get_file_lineage_downstream(parent_table: str, parent_id: str):
     """(For Future Lineage UI) Gets all direct children of a file."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         return [dict(row) for row in conn.execute(
-            "SELECT * FROM gov_file_lineage WHERE parent_table = ? AND parent_id = ?",
-            (parent_table, str(parent_id)) # Ensure parent_id is TEXT
+            "SELECT * FROM gov_file_lineage_named WHERE parent_kind = ? AND parent_id = ?",
+            (LINEAGE_KINDS.get(parent_table), int(parent_id))
         ).fetchall()]
     finally: 
         conn.close()
 
 def get_file_lineage_upstream(child_table: str, child_id: str):
     """(For Future Lineage UI) Gets all direct parents of a file."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         return [dict(row) for row in conn.execute(
-            "SELECT * FROM gov_file_lineage WHERE child_table = ? AND child_id = ?",
-            (child_table, str(child_id)) # Ensure child_id is TEXT
+            "SELECT * FROM gov_file_lineage_named WHERE child_kind = ? AND child_id = ?",
+            (LINEAGE_KINDS.get(child_table), int(child_id))
         ).fetchall()]
     finally: 
         conn.close()
@@ -1462,7 +1599,7 @@ def get_file_lineage_upstream(child_table: str, child_id: str):
 
 def get_milestones_for_env(env_id: str):
     """(For Planning UI) Gets all milestones for an environment (Table 9)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         return [dict(row) for row in conn.execute(
@@ -1480,7 +1617,7 @@ def get_milestones_by_owner(user_id: str, status: str = "Pending"):
 
     In the new model, "Pending" means "not Complete".
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         query = "SELECT * FROM plan_project_milestones WHERE owner_user_id = ?"
@@ -1506,7 +1643,7 @@ def get_action_items_by_owner(user_id: str, status: str = "Open"):
     (For "My Open Items" Tab) Gets all action items assigned to a specific
     user, filtered by a single status (default 'Open').
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         query = "SELECT * FROM plan_action_items WHERE owner_user_id = ?"
@@ -1618,7 +1755,7 @@ def update_milestone_status(milestone_id, status, user_id):
 
 def get_action_items(env_id, status="Open"):
     """(For Planning UI) Gets all action items for an environment (Table 10)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         query = "SELECT * FROM plan_action_items WHERE env_id = ?"
@@ -1723,8 +1860,9 @@ def clone_environment(source_env_id, new_env_id, new_env_name, new_cat, new_purp
         # 2. Clone physical files
         _clone_physical_folders(source_env['env_name'], new_env_name, folders_to_clone)
 
-        # 3. Start DB Transaction
+        # 3. Start DB Transaction (IMMEDIATE: take the write lock up front)
         with conn:
+            conn.execute("BEGIN IMMEDIATE;")
             # 3a. Create the new environment [T1]
             conn.execute(
                 """
@@ -1866,7 +2004,7 @@ def delete_file_blueprint(template_id, user_id):
     if not conn: return False, "Database connection failed."
     try:
         # Check if this blueprint is used by *any* file in any instance table
-        for table in [t for t in TABLE_ID_MAP.keys() if t.startswith("inst_")]:
+        for table, _ in _INST_TABLES:
             row = conn.execute(f"SELECT 1 FROM {table} WHERE template_id = ? LIMIT 1", (template_id,)).fetchone()
             if row: 
                 raise ValueError(f"Cannot delete: Blueprint is in use by table '{table}'. Please 'Archive' it instead by editing its status.")
@@ -2021,8 +2159,8 @@ def upload_new_file_instance(user_id: str, user_role: str, env_id: str, template
                 for parent_table, parent_ids in source_ids_map.items():
                     for parent_id in parent_ids:
                         conn.execute(
-                            "INSERT INTO gov_file_lineage (parent_table, parent_id, child_table, child_id) VALUES (?, ?, ?, ?)",
-                            (parent_table, str(parent_id), table, str(new_file_id_int)) # All IDs as TEXT
+                            "INSERT INTO gov_file_lineage (parent_kind, parent_id, child_kind, child_id) VALUES (?, ?, ?, ?)",
+                            (LINEAGE_KINDS[parent_table], int(parent_id), LINEAGE_KINDS[table], new_file_id_int)
                         )
 
         return True, f"File '{uploaded_file.name}' uploaded successfully. New File ID: {new_file_id_int}."
@@ -2280,8 +2418,8 @@ def run_external_connection_job(user_id: str, user_role: str, env_id: str, templ
                 for parent_table, parent_ids in source_ids_map.items():
                     for parent_id in parent_ids:
                         conn.execute(
-                            "INSERT INTO gov_file_lineage (parent_table, parent_id, child_table, child_id) VALUES (?, ?, ?, ?)",
-                            (parent_table, str(parent_id), table, str(new_file_id_int))
+                            "INSERT INTO gov_file_lineage (parent_kind, parent_id, child_kind, child_id) VALUES (?, ?, ?, ?)",
+                            (LINEAGE_KINDS[parent_table], int(parent_id), LINEAGE_KINDS[table], new_file_id_int)
                         )
 
         return True, f"File '{uploaded_file.name}' downloaded successfully. New File ID: {new_file_id_int}."
@@ -2322,8 +2460,9 @@ def log_user_signoff(user_id: str, user_role: str, target_table: str, target_id:
         if 'all' not in roles_list and user_role not in roles_list:
              raise PermissionError(f"Your role ('{user_role}') is not authorized to be a '{capacity}' for this file.")
 
-        # 3. Start Transaction
+        # 3. Start Transaction (IMMEDIATE: take the write lock up front)
         with conn:
+            conn.execute("BEGIN IMMEDIATE;")
             # a) Log the human action (the "receipt")
             _log_audit(conn, user_id, action, target_table, target_id, comment, capacity)
 
@@ -2352,15 +2491,12 @@ def log_user_signoff(user_id: str, user_role: str, target_table: str, target_id:
 
 def find_orphaned_files():
     """Finds DB records (Tables 3-6) with no matching physical file."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     orphans = []
     try:
         # Iterate robustly using our map
-        for table, id_col in TABLE_ID_MAP.items():
-            if not table.startswith("inst_"):
-                continue # Only care about file tables
-
+        for table, id_col in _INST_TABLES:
             query = f'SELECT "{id_col}", file_path, env_id FROM "{table}"'
             files = conn.execute(query).fetchall()
 
@@ -2379,7 +2515,7 @@ def find_orphaned_files():
 
 def find_orphaned_folders():
     """Finds physical folders with no matching DB record (Table 1)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     orphans = []
     try:
@@ -2401,14 +2537,11 @@ def find_orphaned_folders():
 
 def find_broken_blueprint_links():
     """Finds files (Tables 3-6) pointing to a non-existent blueprint (Table 2)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     broken_links = []
     try:
-        for table, id_col in TABLE_ID_MAP.items():
-            if not table.startswith("inst_"):
-                continue
-
+        for table, id_col in _INST_TABLES:
             query = f"""
                     SELECT T1."{id_col}", T1.template_id, T1.env_id
                     FROM "{table}" AS T1
@@ -2429,7 +2562,7 @@ def find_broken_blueprint_links():
 
 def find_unused_blueprints():
     """Finds 'Active' blueprints (Table 2) that are not used by any file (Tables 3-6)."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         # This query unions all file tables to see if an active blueprint has any children
@@ -2452,7 +2585,7 @@ def find_unused_blueprints():
 
 def validate_all_blueprint_json():
     """Scans all JSON fields in Table 2 for invalid syntax."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     errors = []
     try:
@@ -2516,7 +2649,7 @@ def prune_archived_environment(env_id: str, user_id: str):
 
 def get_system_kpis():
     """(For System Status UI) Get high-level counts of all main objects."""
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return {}
     try:
         kpis = {}
@@ -2544,14 +2677,11 @@ def get_pending_actions_dashboard():
     that are 'Active' but do not have a 'Doer' sign-off.
     This is a simplified query; a real one would be more complex.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         union_parts = []
-        for table, id_col in TABLE_ID_MAP.items():
-            if not table.startswith("inst_"):
-                continue
-
+        for table, id_col in _INST_TABLES:
             union_parts.append(f"""
                 SELECT T1.file_path, T1.template_id, T1.env_id, T1.created_by, T1.created_at,
                        '{table}' as table_name, CAST(T1.{id_col} AS TEXT) as file_id
@@ -2595,7 +2725,7 @@ def get_all_files_dataframe_for_env(env_id: str):
     This is a heavy, complex query that joins all file and blueprint
     data and calculates the governance status for *all* files.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return pd.DataFrame()
 
     # 1. Build a UNION ALL query to stack all 4 file tables
@@ -2699,7 +2829,7 @@ def get_audit_log_for_environment(env_id: str):
     Gets *all* audit logs for a specific environment by finding all
     files in that env and getting their logs.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return []
     try:
         # 1. Get all file IDs in the environment
@@ -2739,7 +2869,7 @@ def get_full_lineage_graph(env_id: str):
     Gets all nodes (files) and edges (links) for the lineage chart
     in a specific environment.
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return {'nodes': [], 'edges': []}
 
     try:
@@ -2758,7 +2888,7 @@ def get_full_lineage_graph(env_id: str):
 
         # 2. Get all edges (links)
         edges = []
-        links = conn.execute("SELECT * FROM gov_file_lineage").fetchall()
+        links = conn.execute("SELECT * FROM gov_file_lineage_named").fetchall()
         for link in links:
             # We must build the same unique ID as above
             parent_id = f"{link['parent_table']}_{link['parent_id']}"
@@ -2788,7 +2918,7 @@ def get_system_integrity_report(env_id: str):
     2. Finds orphaned folders (Disk, no DB) - This is global, not env-specific
     3. Finds hash mismatches (tampering)
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return {}
 
     report = {
@@ -2849,7 +2979,7 @@ def get_all_permissions():
     Gets the full user/file permissions matrix by cross-referencing
     all blueprints with all known users (from the audit log).
     """
-    conn = _get_db_conn()
+    conn = _get_db_conn(read_only=True)
     if not conn: return {'by_user': {}, 'by_file': {}}
     try:
         blueprints = [dict(row) for row in conn.execute("SELECT * FROM bp_file_templates").fetchall()]
@@ -0,0 +1,96 @@
+"""Checks for registry_schema.initialize_database() on a fresh database."""
+
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import registry_schema
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    db_file = str(tmp_path / "atlas_registry.db")
+    monkeypatch.setattr(registry_schema, "DB_FILE", db_file)
+    registry_schema.initialize_database()
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "INSERT INTO bp_environments (env_id, env_name, env_cat) VALUES ('E1', 'Env 1', 'Dev')"
+    )
+    yield conn
+    conn.close()
+
+
+def _stats(conn):
+    return conn.execute(
+        "SELECT plan_total, plan_complete, action_open FROM env_stats WHERE env_id = 'E1'"
+    ).fetchone()
+
+
+def test_env_stats_accepts_null_status(conn):
+    conn.execute(
+        "INSERT INTO plan_project_milestones (env_id, title, status) VALUES ('E1', 'M', NULL)"
+    )
+    conn.execute(
+        "INSERT INTO plan_action_items (env_id, description, owner_user_id, status)"
+        " VALUES ('E1', 'A', 'u', NULL)"
+    )
+    assert _stats(conn) == (1, 0, 0)
+
+    conn.execute("UPDATE plan_project_milestones SET status = 'Complete'")
+    conn.execute("UPDATE plan_action_items SET status = 'Open'")
+    assert _stats(conn) == (1, 1, 1)
+
+    conn.execute("UPDATE plan_project_milestones SET status = NULL")
+    conn.execute("UPDATE plan_action_items SET status = NULL")
+    assert _stats(conn) == (1, 0, 0)
+
+
+def test_apply_schema_upgrades_shipped_database(tmp_path):
+    db_file = tmp_path / "atlas_registry.db"
+    shutil.copy(Path(registry_schema.__file__).with_name("atlas_registry.db"), db_file)
+    conn = sqlite3.connect(db_file)
+    registry_schema.apply_schema(conn)
+    registry_schema.apply_schema(conn)  # and again: it must be idempotent
+
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {"bp_environment_roles", "env_stats"} <= tables
+    assert not registry_schema._has_old_lineage(conn)
+    conn.close()
+
+
+def test_apply_schema_upgrades_rowid_dependencies(conn):
+    conn.executescript(
+        """
+        DROP TABLE plan_dependencies;
+        CREATE TABLE plan_dependencies (
+            dependency_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            predecessor_task_id INTEGER NOT NULL
+        );
+        CREATE INDEX idx_deps_by_task ON plan_dependencies (task_id);
+        CREATE INDEX idx_deps_by_predecessor ON plan_dependencies (predecessor_task_id);
+        INSERT INTO plan_dependencies (task_id, predecessor_task_id) VALUES (2, 1), (2, 1), (3, 2);
+        """
+    )
+    registry_schema.apply_schema(conn)
+
+    assert not registry_schema._has_old_dependencies(conn)
+    assert conn.execute(
+        "SELECT task_id, predecessor_task_id FROM plan_dependencies ORDER BY 1, 2"
+    ).fetchall() == [(2, 1), (3, 2)]
+    indexes = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'plan_dependencies'"
+    )}
+    assert "idx_deps_by_predecessor" in indexes
+    assert "idx_deps_by_task" not in indexes
+
+
+def test_open_helpers_follow_repointed_db_file(conn):
+    # The conn fixture has repointed registry_schema.DB_FILE to a temp file
+    conn.commit()
+    for open_db in (registry_schema.open_rw, registry_schema.open_ro):
+        db = open_db()
+        assert db.execute("SELECT env_id FROM bp_environments").fetchall() == [("E1",)]
+        db.close()